@@ -3,7 +3,29 @@
 day=${1?"usage: $0 <day>"}
 
 mkdir -p src/dec$day
-echo "#!/usr/bin/env python3" > src/dec$day/solve.py
+cat > src/dec$day/solve.py <<'PY'
+#!/usr/bin/env python3
+
+import sys
+
+
+def parse(input: str):
+    return input
+
+
+def part_a(model):
+    pass
+
+
+def part_b(model):
+    pass
+
+
+if __name__ == "__main__":
+    model = parse(sys.stdin.read())
+    print("a:", part_a(model))
+    print("b:", part_b(model))
+PY
 chmod +x src/dec$day/solve.py
 touch src/dec$day/input.txt
 touch src/dec$day/example.txt
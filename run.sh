@@ -1,12 +1,18 @@
 #!/bin/bash
 
-day=${1?"usage: $0 <day>"}
+day=${1?"usage: $0 <day> [input] [debug|nodebug|profile]"}
 input=${2:-'input'}
-debug=
+
+cd "$(dirname "$0")/src" || exit 1
+
+if [[ ${3:-''} == "profile" ]]; then
+    exec python3 -m aoc.profiling "$day" -i "$input"
+fi
+
+watch=(python3 -m aoc.watch "$day" -i "$input")
 if [[ ${3:-''} == "debug" ]]; then
-    debug="2> src/dec$day/debug.out"
+    exec "${watch[@]}" 2> "dec$day/debug.out"
 elif [[ ${3:-''} == "nodebug" ]]; then
-    debug="2> /dev/null"
+    exec "${watch[@]}" 2> /dev/null
 fi
-
-find src/dec$day -type f -name '*.py' -or -name '*.txt' | entr -rc sh -c "echo Running dec $day with $input.txt && ./src/dec$day/solve.py < src/dec$day/$input.txt $debug"
+exec "${watch[@]}"
@@ -0,0 +1,87 @@
+import argparse
+import json
+import pathlib
+import sys
+
+from aoc import cache, solvers, telemetry
+
+
+def show(day: int, part: str, answer, cached=False) -> str:
+    answer = str(answer)
+    sep = "\n" if "\n" in answer else " "
+    note = " (cached)" if cached else ""
+    return f"dec{day:02d} {part}{note}:{sep}{answer}"
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python3 -m aoc")
+    parser.add_argument("days", nargs="*", type=int, default=solvers.DAYS)
+    parser.add_argument(
+        "-i",
+        "--input",
+        default="input",
+        help="input name, e.g. 'example', or a path to a file",
+    )
+    parser.add_argument(
+        "-p",
+        "--parts",
+        default="".join(solvers.PARTS),
+        help="which parts to run, e.g. 'a' or 'ab'",
+    )
+    parser.add_argument(
+        "--cache", type=pathlib.Path, default=cache.DEFAULT_PATH
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=cache.DEFAULT_SIZE, help="in bytes"
+    )
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument(
+        "--telemetry",
+        type=pathlib.Path,
+        help="append timings, peak RSS and memo cache stats as JSON lines",
+    )
+    args = parser.parse_args()
+
+    solve = solvers.solve
+    if args.telemetry:
+        recorder = telemetry.Recorder()
+        solve = recorder.solve
+
+    store = None
+    if not args.no_cache:
+        store = cache.Cache(args.cache, args.cache_size)
+
+    for day in args.days:
+        path = solvers.input_path(day, args.input)
+        if not path.exists():
+            print(f"dec{day:02d}: no {path.name}; skipping", file=sys.stderr)
+            continue
+        input = path.read_text()
+        if args.telemetry:
+            recorder.context = {"input": str(path)}
+
+        if store is not None:
+            answers = store.solve(day, input, args.parts, solve)
+        else:
+            solved = solve(day, input, args.parts)
+            answers = {
+                part: (answer, False) for part, answer in solved.items()
+            }
+
+        for part, (answer, hit) in answers.items():
+            print(show(day, part, answer, cached=hit), flush=True)
+
+    if args.telemetry:
+        with args.telemetry.open("a") as f:
+            for record in recorder.records:
+                f.write(json.dumps(record) + "\n")
+
+    if store is not None:
+        print(
+            f"cache: {store.hits} hits, {store.misses} misses",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import argparse
+import concurrent.futures
+import json
+import os
+import pathlib
+import signal
+import sys
+import time
+from typing import Any, Iterable, NamedTuple, Optional
+
+from aoc import cache, solvers, telemetry
+
+
+class Job(NamedTuple):
+    day: int
+    input: pathlib.Path
+    part: str
+
+
+def jobs(
+    days: Iterable[int], inputs: Iterable[str], parts: str
+) -> list[Job]:
+    found = []
+    for day in days:
+        for pattern in inputs:
+            for path in sorted(
+                (solvers.ROOT / f"dec{day:02d}").glob(f"{pattern}.txt")
+            ):
+                found.extend(Job(day, path, part) for part in parts)
+    return found
+
+
+def timed_out(signum, frame):
+    raise TimeoutError()
+
+
+def run(
+    job: Job,
+    timeout: Optional[float],
+    store: Optional[cache.Cache],
+    measure: bool,
+) -> dict[str, Any]:
+    record: dict[str, Any] = {
+        "day": job.day,
+        "input": str(job.input),
+        "part": job.part,
+    }
+
+    if timeout:
+        signal.signal(signal.SIGALRM, timed_out)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    recorder = telemetry.Recorder()
+    solve = recorder.solve if measure else solvers.solve
+
+    start = time.perf_counter()
+    try:
+        input = job.input.read_text()
+        if store is not None:
+            solved = store.solve(job.day, input, job.part, solve)
+            answer, record["cached"] = solved[job.part]
+        else:
+            answer = solve(job.day, input, job.part)[job.part]
+        record["answer"] = answer
+        if recorder.records:
+            record["telemetry"] = recorder.records[-1]
+    except TimeoutError:
+        record["error"] = f"timed out after {timeout}s"
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def batch(
+    jobs: list[Job],
+    workers: Optional[int],
+    timeout: Optional[float],
+    store: Optional[cache.Cache] = None,
+    measure: bool = False,
+) -> Iterable[dict[str, Any]]:
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run, job, timeout, store, measure) for job in jobs
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python3 -m aoc.batch")
+    parser.add_argument("days", nargs="*", type=int, default=solvers.DAYS)
+    parser.add_argument(
+        "-i",
+        "--input",
+        action="append",
+        help="input name or glob within each day, e.g. 'input*' "
+        "(repeatable; default: input)",
+    )
+    parser.add_argument("-p", "--parts", default="".join(solvers.PARTS))
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "-t", "--timeout", type=float, help="per-job timeout in seconds"
+    )
+    parser.add_argument(
+        "--cache", type=pathlib.Path, default=cache.DEFAULT_PATH
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=cache.DEFAULT_SIZE, help="in bytes"
+    )
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument(
+        "--telemetry",
+        action="store_true",
+        help="include timings, peak RSS and memo cache stats in each record",
+    )
+    args = parser.parse_args()
+
+    store = None
+    if not args.no_cache:
+        store = cache.Cache(args.cache, args.cache_size)
+
+    hits, misses = 0, 0
+    for record in batch(
+        jobs(args.days, args.input or ["input"], args.parts),
+        args.workers,
+        args.timeout,
+        store,
+        args.telemetry,
+    ):
+        if "cached" in record:
+            hits += record["cached"]
+            misses += not record["cached"]
+        print(json.dumps(record, default=str), flush=True)
+
+    if store is not None:
+        print(f"cache: {hits} hits, {misses} misses", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
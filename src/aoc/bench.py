@@ -0,0 +1,140 @@
+import argparse
+import json
+import pathlib
+import statistics
+import sys
+import time
+import tracemalloc
+from types import ModuleType
+from typing import Any, Callable
+
+from aoc import generate, solvers
+
+STAGES = ("parse", *solvers.PARTS)
+
+
+def stage(solver: ModuleType, name: str, input: str) -> Callable[[], Any]:
+    if name == "parse":
+        return lambda: solver.parse(input)
+
+    model = solver.parse(input)
+    part = getattr(solver, f"part_{name}")
+    return lambda: part(model)
+
+
+def timings(solver: ModuleType, f: Callable[[], Any], repeats: int):
+    runs = []
+    for _ in range(repeats):
+        solvers.reset(solver)
+        start = time.perf_counter()
+        f()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def peak_memory(solver: ModuleType, f: Callable[[], Any]) -> int:
+    solvers.reset(solver)
+    tracemalloc.start()
+    try:
+        f()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench(day: int, input: str, repeats: int) -> dict[str, Any]:
+    solver = solvers.load(day)
+    result: dict[str, Any] = {"bytes": len(input)}
+    for name in STAGES:
+        f = stage(solver, name, input)
+        runs = timings(solver, f, repeats)
+        result[name] = {
+            "median": statistics.median(runs),
+            "runs": runs,
+            "peak": peak_memory(solver, f),
+        }
+    return result
+
+
+def sweep(
+    day: int, sizes: list[int], repeats: int, seed: int
+) -> list[dict[str, Any]]:
+    return [
+        {"size": n, **bench(day, generate.generate(day, n, seed), repeats)}
+        for n in sizes
+    ]
+
+
+def summary(result) -> str:
+    if isinstance(result, list):
+        return "; ".join(f"n={r['size']}: {summary(r)}" for r in result)
+    return " ".join(f"{name}={result[name]['median']:.4f}s" for name in STAGES)
+
+
+def regressions(
+    results: dict[str, Any], baseline: dict[str, Any], tolerance: float
+):
+    for day, result in results.items():
+        for name in STAGES:
+            then = baseline.get(day, {}).get(name)
+            if not then or name not in result:
+                continue
+            now = result[name]["median"]
+            if now > then["median"] * (1 + tolerance):
+                yield day, name, then["median"], now
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python3 -m aoc.bench")
+    parser.add_argument("days", nargs="*", type=int, default=solvers.DAYS)
+    parser.add_argument("-i", "--input", default="input")
+    parser.add_argument("-r", "--repeats", type=int, default=5)
+    parser.add_argument(
+        "--sweep",
+        type=lambda s: [int(n) for n in s.split(",")],
+        help="comma-separated sizes of generated inputs to time, "
+        "instead of the input file",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "-o", "--output", type=pathlib.Path, help="write results here"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=pathlib.Path,
+        help="compare medians against results saved with --output",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {}
+    for day in args.days:
+        key = f"dec{day:02d}"
+        if args.sweep:
+            if day not in generate.generators:
+                print(f"{key}: no input generator; skipping", file=sys.stderr)
+                continue
+            results[key] = sweep(day, args.sweep, args.repeats, args.seed)
+        else:
+            input = solvers.read_input(day, args.input)
+            results[key] = bench(day, input, args.repeats)
+        print(key, summary(results[key]), file=sys.stderr, flush=True)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.baseline and not args.sweep:
+        baseline = json.loads(args.baseline.read_text())
+        slower = list(regressions(results, baseline, args.tolerance))
+        for day, name, then, now in slower:
+            print(
+                f"{day} {name}: {then:.4f}s -> {now:.4f}s", file=sys.stderr
+            )
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
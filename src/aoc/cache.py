@@ -0,0 +1,120 @@
+import hashlib
+import inspect
+import json
+import os
+import pathlib
+import tempfile
+from types import ModuleType
+from typing import Any, Iterable
+
+from aoc import solvers
+
+DEFAULT_PATH = (
+    pathlib.Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    / "aoc-2022"
+)
+DEFAULT_SIZE = 64 * 1024 * 1024
+
+
+def shared_modules(solver: ModuleType) -> Iterable[ModuleType]:
+    # modules under src that the solver imports, or imports names from
+    for v in vars(solver).values():
+        m = v if isinstance(v, ModuleType) else inspect.getmodule(v)
+        f = getattr(m, "__file__", None)
+        if m is solver or not f:
+            continue
+        if solvers.ROOT in pathlib.Path(f).parents:
+            yield m
+
+
+def sources(solver: ModuleType) -> Iterable[pathlib.Path]:
+    yield pathlib.Path(solver.__file__)
+    # shared modules count as part of the solver's source too
+    for m in shared_modules(solver):
+        yield pathlib.Path(m.__file__)
+
+
+def source_hash(solver: ModuleType) -> str:
+    h = hashlib.sha256()
+    for path in sorted(set(sources(solver))):
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+class Cache:
+    def __init__(self, path: pathlib.Path = DEFAULT_PATH, size=DEFAULT_SIZE):
+        self.path = path
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, source: str, input: str, part: str) -> str:
+        h = hashlib.sha256()
+        h.update(source.encode())
+        h.update(part.encode())
+        h.update(input.encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        entry = self.path / key
+        try:
+            answer = json.loads(entry.read_text())
+        except (FileNotFoundError, ValueError):
+            self.misses += 1
+            return False, None
+
+        # bump the entry's recency for eviction
+        os.utime(entry)
+        self.hits += 1
+        return True, answer
+
+    def put(self, key: str, answer: Any):
+        self.path.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.path, prefix=".", delete=False
+        ) as f:
+            json.dump(answer, f)
+        os.replace(f.name, self.path / key)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for e in os.scandir(self.path):
+            try:
+                stat = e.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, e.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def solve(
+        self,
+        day: int,
+        input: str,
+        parts: Iterable[str] = solvers.PARTS,
+        solve=solvers.solve,
+    ) -> dict[str, tuple[Any, bool]]:
+        source = source_hash(solvers.load(day))
+        keys = {part: self.key(source, input, part) for part in parts}
+        found = {part: self.get(key) for part, key in keys.items()}
+
+        answers = {}
+        missing = [part for part, (hit, _) in found.items() if not hit]
+        if missing:
+            answers = solve(day, input, missing)
+            for part, answer in answers.items():
+                self.put(keys[part], answer)
+
+        return {
+            part: (answers[part], False) if part in answers else (answer, True)
+            for part, (_, answer) in found.items()
+        }
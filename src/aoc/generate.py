@@ -0,0 +1,364 @@
+import argparse
+import itertools
+import json
+import random
+import string
+from typing import Callable
+
+Generator = Callable[[random.Random, int], str]
+
+generators: dict[int, Generator] = {}
+
+
+def generator(day: int):
+    def register(f: Generator) -> Generator:
+        generators[day] = f
+        return f
+
+    return register
+
+
+@generator(1)
+def calories(rng: random.Random, n: int) -> str:
+    return "\n\n".join(
+        "\n".join(
+            str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15))
+        )
+        for _ in range(n)
+    )
+
+
+@generator(2)
+def strategy_guide(rng: random.Random, n: int) -> str:
+    return "\n".join(
+        f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(n)
+    )
+
+
+@generator(3)
+def rucksacks(rng: random.Random, n: int) -> str:
+    items = string.ascii_letters
+
+    def rucksack(own: list[str], badge: str) -> str:
+        shared, *rest = own
+        cut = len(rest) // 2
+        left = [shared, badge, *rest[:cut]]
+        right = [shared, *rest[cut:]]
+        size = max(len(left), len(right)) + rng.randint(0, 8)
+        left += rng.choices(left, k=size - len(left))
+        right += rng.choices(right, k=size - len(right))
+        rng.shuffle(left)
+        rng.shuffle(right)
+        return "".join(left + right)
+
+    def group() -> list[str]:
+        badge, *rest = rng.sample(items, len(items))
+        # give each elf its own items, so only the badge is common to all
+        owns = [rest[i::3][: rng.randint(2, 17)] for i in range(3)]
+        return [rucksack(own, badge) for own in owns]
+
+    return "\n".join(
+        rucksack for _ in range(-(-n // 3)) for rucksack in group()
+    )
+
+
+@generator(4)
+def section_assignments(rng: random.Random, n: int) -> str:
+    def section():
+        lo = rng.randint(1, 99)
+        return f"{lo}-{rng.randint(lo, 99)}"
+
+    return "\n".join(f"{section()},{section()}" for _ in range(n))
+
+
+@generator(5)
+def crane_procedure(rng: random.Random, n: int) -> str:
+    n_stacks = 9
+    stacks = [
+        rng.choices(string.ascii_uppercase, k=rng.randint(1, 8))
+        for _ in range(n_stacks)
+    ]
+    drawing = [
+        " ".join(
+            f"[{stack[level]}]" if level < len(stack) else "   "
+            for stack in stacks
+        )
+        for level in reversed(range(max(map(len, stacks))))
+    ]
+    drawing.append(" ".join(f" {i + 1} " for i in range(n_stacks)))
+
+    # only ever move some of a stack, so no stack ends up empty
+    heights = [len(stack) for stack in stacks]
+    moves = []
+    for _ in range(n):
+        src = rng.choice([i for i, h in enumerate(heights) if h > 1])
+        dst = rng.choice([i for i in range(n_stacks) if i != src])
+        k = rng.randint(1, min(heights[src] - 1, 10))
+        heights[src] -= k
+        heights[dst] += k
+        moves.append(f"move {k} from {src + 1} to {dst + 1}")
+
+    return "\n".join(drawing) + "\n\n" + "\n".join(moves)
+
+
+@generator(6)
+def datastream(rng: random.Random, n: int) -> str:
+    # three letters never make a marker, so both are found at the very end
+    return "".join(
+        [
+            *rng.choices("abc", k=n),
+            *rng.sample("defghijklmnopqrstuvwxyz", 14),
+            rng.choice("abc"),
+        ]
+    )
+
+
+@generator(7)
+def terminal_transcript(rng: random.Random, n: int) -> str:
+    children: dict[int, list[int]] = {0: []}
+    for d in range(1, n):
+        # attach to a recent directory to get deep, narrow trees
+        children[rng.randint(max(0, d - 3), d - 1)].append(d)
+        children[d] = []
+
+    lines = []
+    # depth-first, but without recursion so deep trees are fine
+    stack = [(0, "/", iter(children[0]), False)]
+    while stack:
+        d, name, rest, entered = stack.pop()
+        if not entered:
+            lines.append(f"$ cd {name}")
+            lines.append("$ ls")
+            lines.extend(f"dir d{child}" for child in children[d])
+            lines.extend(
+                f"{rng.randint(1000, 300000)} f{i}.txt"
+                for i in range(rng.randint(0, 4))
+            )
+        child = next(rest, None)
+        if child is None:
+            if d:
+                lines.append("$ cd ..")
+            continue
+        stack.append((d, name, rest, True))
+        stack.append((child, f"d{child}", iter(children[child]), False))
+
+    return "\n".join(lines)
+
+
+@generator(8)
+def forest(rng: random.Random, n: int) -> str:
+    return "\n".join(
+        "".join(rng.choices(string.digits, k=n)) for _ in range(n)
+    )
+
+
+@generator(9)
+def rope_motions(rng: random.Random, n: int) -> str:
+    return "\n".join(
+        f"{rng.choice('LRUD')} {rng.randint(1, 20)}" for _ in range(n)
+    )
+
+
+@generator(10)
+def program(rng: random.Random, n: int) -> str:
+    x, lines = 1, []
+    for _ in range(n):
+        if rng.random() < 0.3:
+            lines.append("noop")
+            continue
+        # keep the sprite roughly on screen
+        v = rng.randint(-min(10, x + 5), min(10, 45 - x)) or 1
+        x += v
+        lines.append(f"addx {v}")
+    return "\n".join(lines)
+
+
+@generator(11)
+def monkeys(rng: random.Random, n: int) -> str:
+    # every monkey throws to two others
+    n = max(n, 3)
+    primes = [
+        p
+        for p in itertools.islice(itertools.count(2), n * n + 10)
+        if all(p % q for q in range(2, int(p**0.5) + 1))
+    ]
+
+    def operation():
+        match rng.randint(0, 2):
+            case 0:
+                return "old * old"
+            case 1:
+                return f"old * {rng.randint(2, 19)}"
+            case _:
+                return f"old + {rng.randint(1, 8)}"
+
+    def monkey(i, divisor):
+        if_true, if_false = rng.sample([j for j in range(n) if j != i], 2)
+        items = ", ".join(
+            str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8))
+        )
+        return "\n".join(
+            [
+                f"Monkey {i}:",
+                f"  Starting items: {items}",
+                f"  Operation: new = {operation()}",
+                f"  Test: divisible by {divisor}",
+                f"    If true: throw to monkey {if_true}",
+                f"    If false: throw to monkey {if_false}",
+            ]
+        )
+
+    return "\n\n".join(
+        monkey(i, divisor) for i, divisor in enumerate(primes[:n])
+    )
+
+
+@generator(12)
+def heightmap(rng: random.Random, n: int) -> str:
+    # wide enough that S, in a far corner, is at least 26 steps from E
+    width, height = max(n, 52), max(n // 4, 2)
+    E = (rng.randrange(width), rng.randrange(height))
+    S = (0, 0) if E[0] >= width // 2 else (width - 1, height - 1)
+
+    # rings around E that drop by one per step down to a, so E is reachable
+    def elevation(x, y):
+        if (x, y) == S:
+            return "S"
+        if (x, y) == E:
+            return "E"
+        ring = min(25, abs(x - E[0]) + abs(y - E[1]))
+        return string.ascii_lowercase[25 - ring]
+
+    return "\n".join(
+        "".join(elevation(x, y) for x in range(width)) for y in range(height)
+    )
+
+
+@generator(13)
+def packets(rng: random.Random, n: int) -> str:
+    def packet(depth=0):
+        return [
+            rng.randint(0, 10)
+            if rng.random() < 0.5 + depth / 8
+            else packet(depth + 1)
+            for _ in range(rng.randint(0, 5))
+        ]
+
+    def dump(p):
+        return json.dumps(p, separators=(",", ":"))
+
+    return "\n\n".join(
+        f"{dump(packet())}\n{dump(packet())}" for _ in range(n)
+    )
+
+
+@generator(14)
+def rock_paths(rng: random.Random, n: int) -> str:
+    spread, depth = 5 + n, 5 + n // 2
+
+    def path():
+        x, y = 500 + rng.randint(-spread, spread), rng.randint(2, depth)
+        points = [(x, y)]
+        for i in range(rng.randint(1, 4)):
+            if i % 2:
+                y = min(depth, max(2, y + rng.randint(-6, 6)))
+            else:
+                x += rng.randint(-6, 6)
+            points.append((x, y))
+        return " -> ".join(f"{x},{y}" for x, y in points)
+
+    return "\n".join(path() for _ in range(n))
+
+
+@generator(15)
+def sensors(rng: random.Random, n: int) -> str:
+    size = 4000000
+    # a hidden spot that no sensor covers, so part b always has an answer
+    px, py = rng.randint(0, size), rng.randint(0, size)
+
+    def sensor():
+        sx, sy = rng.randint(0, size), rng.randint(0, size)
+        d = abs(px - sx) + abs(py - sy) - 1
+        if d < 1:
+            return None
+        dx = rng.randint(0, d)
+        bx = sx + (dx if px > sx else -dx)
+        by = sy + ((d - dx) if py > sy else -(d - dx))
+        return (
+            f"Sensor at x={sx}, y={sy}: closest beacon is at x={bx}, y={by}"
+        )
+
+    return "\n".join(
+        itertools.islice(filter(None, iter(sensor, object())), n)
+    )
+
+
+@generator(16)
+def valves(rng: random.Random, n: int) -> str:
+    names = ["AA"] + rng.sample(
+        [
+            a + b
+            for a, b in itertools.product(string.ascii_uppercase, repeat=2)
+            if a + b != "AA"
+        ],
+        min(n, 676) - 1,
+    )
+    tunnels: dict[str, set[str]] = {v: set() for v in names}
+    for i, v in enumerate(names[1:], start=1):
+        u = names[rng.randrange(i)]
+        tunnels[u].add(v)
+        tunnels[v].add(u)
+    for _ in range(len(names) // 2):
+        u, v = rng.sample(names, 2)
+        tunnels[u].add(v)
+        tunnels[v].add(u)
+
+    useful = set(rng.sample(names[1:], min(15, len(names) // 4 + 1)))
+
+    def valve(v):
+        rate = rng.randint(1, 25) if v in useful else 0
+        to = sorted(tunnels[v])
+        leads = (
+            f"tunnel leads to valve {to[0]}"
+            if len(to) == 1
+            else f"tunnels lead to valves {', '.join(to)}"
+        )
+        return f"Valve {v} has flow rate={rate}; {leads}"
+
+    return "\n".join(map(valve, names))
+
+
+@generator(17)
+def jets(rng: random.Random, n: int) -> str:
+    return "".join(rng.choices("<>", k=n))
+
+
+@generator(18)
+def lava_droplet(rng: random.Random, n: int) -> str:
+    side = max(3, round(n ** (1 / 3) * 1.5))
+    cells = set()
+    while len(cells) < n:
+        cells.add(tuple(rng.randrange(side) for _ in range(3)))
+    return "\n".join(",".join(map(str, c)) for c in cells)
+
+
+def generate(day: int, n: int, seed: int = 0) -> str:
+    return generators[day](random.Random(seed), n) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python3 -m aoc.generate")
+    parser.add_argument("day", type=int, choices=sorted(generators))
+    parser.add_argument(
+        "size",
+        type=int,
+        help="scale of the input, e.g. number of elves, forest side length",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(generate(args.day, args.size, args.seed), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import array
+from typing import Callable, Iterator, Optional
+
+
+# A dense 2D grid of small ints, stored row by row in one flat array. Cells
+# are addressed by (x, y) relative to the origin, or by their flat index into
+# `cells`, which avoids building a tuple per access in hot loops.
+class Grid:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        typecode: str = "b",
+        fill: int = 0,
+        origin: tuple[int, int] = (0, 0),
+        cells: Optional[array.array] = None,
+    ):
+        # `cells`, if given, is used as is rather than filled in
+        if cells is None:
+            cells = array.array(typecode, [fill]) * (width * height)
+        elif len(cells) != width * height:
+            raise ValueError(f"{len(cells)} cells for {width}x{height}")
+        self.width = width
+        self.height = height
+        self.x0, self.y0 = origin
+        self.cells = cells
+
+    @classmethod
+    def parse(
+        cls, input: str, cell: Callable[[str], int] = int, typecode: str = "b"
+    ) -> "Grid":
+        lines = [line.strip() for line in input.splitlines() if line.strip()]
+        cells = array.array(
+            typecode, (cell(c) for line in lines for c in line)
+        )
+        return cls(len(lines[0]), len(lines), cells=cells)
+
+    def copy(self) -> "Grid":
+        return Grid(
+            self.width,
+            self.height,
+            origin=(self.x0, self.y0),
+            cells=array.array(self.cells.typecode, self.cells),
+        )
+
+    @property
+    def bounds(self) -> tuple[int, int, int, int]:
+        return (
+            self.x0,
+            self.x0 + self.width - 1,
+            self.y0,
+            self.y0 + self.height - 1,
+        )
+
+    def index(self, x: int, y: int) -> int:
+        return (y - self.y0) * self.width + (x - self.x0)
+
+    def point(self, i: int) -> tuple[int, int]:
+        y, x = divmod(i, self.width)
+        return x + self.x0, y + self.y0
+
+    def __contains__(self, p: tuple[int, int]) -> bool:
+        x, y = p
+        return (
+            0 <= x - self.x0 < self.width and 0 <= y - self.y0 < self.height
+        )
+
+    def __getitem__(self, p: tuple[int, int]) -> int:
+        return self.cells[self.index(*p)]
+
+    def __setitem__(self, p: tuple[int, int], v: int):
+        self.cells[self.index(*p)] = v
+
+    def get(self, p: tuple[int, int], default: Optional[int] = None):
+        return self[p] if p in self else default
+
+    def neighbors(self, i: int) -> Iterator[int]:
+        x = i % self.width
+        if x > 0:
+            yield i - 1
+        if x < self.width - 1:
+            yield i + 1
+        if i >= self.width:
+            yield i - self.width
+        if i + self.width < len(self.cells):
+            yield i + self.width
+
+    def row(self, y: int) -> memoryview:
+        start = (y - self.y0) * self.width
+        return memoryview(self.cells)[start : start + self.width]
+
+    def column(self, x: int) -> memoryview:
+        return memoryview(self.cells)[x - self.x0 :: self.width]
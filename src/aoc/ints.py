@@ -0,0 +1,26 @@
+import array
+import re
+from typing import Union
+
+# every byte that isn't a digit separates numbers
+SEPARATORS = bytes(b if b in b"0123456789" else ord(" ") for b in range(256))
+SIGNED = re.compile(rb"-?\d+")
+
+
+def ints(input: Union[str, bytes], signed=False) -> array.array:
+    # unsigned parsing treats '-' as a separator, as in dec04's "2-4,6-8"
+    data = input.encode() if isinstance(input, str) else input
+    if signed:
+        tokens = SIGNED.findall(data)
+    else:
+        tokens = data.translate(SEPARATORS).split()
+    return array.array("q", map(int, tokens))
+
+
+def columns(values: array.array, stride: int) -> tuple[memoryview, ...]:
+    if len(values) % stride:
+        raise ValueError(
+            f"{len(values)} integers don't split into records of {stride}"
+        )
+    view = memoryview(values)
+    return tuple(view[i::stride] for i in range(stride))
@@ -0,0 +1,276 @@
+import argparse
+import collections
+import cProfile
+import functools
+import io
+import pathlib
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from types import FrameType
+from typing import Any, Callable, Optional
+
+from aoc import solvers
+from aoc.bench import STAGES, stage
+
+Func = tuple[str, int, str]
+
+
+def label(func: Func) -> str:
+    file, line, name = func
+    return f"{name} ({pathlib.Path(file).name}:{line})"
+
+
+def report(profile: cProfile.Profile, sort: str, limit: int) -> str:
+    out = io.StringIO()
+    stats = pstats.Stats(profile, stream=out)
+    stats.sort_stats(sort).print_stats(limit)
+    return out.getvalue()
+
+
+def collapsed_from_profile(profile: cProfile.Profile) -> collections.Counter:
+    # cProfile only records caller/callee pairs, so split each function's
+    # time over the paths leading to it in proportion to their edge times
+    stats: dict[Func, Any] = pstats.Stats(profile).stats  # type: ignore
+    callees: dict[Func, dict[Func, float]] = collections.defaultdict(dict)
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, ct) in callers.items():
+            callees[caller][func] = ct
+
+    stacks: collections.Counter = collections.Counter()
+
+    def walk(func: Func, path: tuple[str, ...], share: float):
+        _, _, tt, ct, _ = stats[func]
+        path = (*path, label(func))
+        stacks[";".join(path)] += share * tt
+        if len(path) > 100:
+            return
+        for callee, edge in callees[func].items():
+            if label(callee) in path or not stats[callee][3]:
+                continue
+            part = share * edge / stats[callee][3]
+            if part * stats[callee][3] > 1e-6:
+                walk(callee, path, part)
+
+    roots = [f for f, (_, _, _, _, callers) in stats.items() if not callers]
+    for root in roots:
+        walk(root, (), 1.0)
+
+    # flame graph tools expect integer weights; use microseconds
+    return collections.Counter(
+        {k: round(v * 1e6) for k, v in stacks.items() if round(v * 1e6)}
+    )
+
+
+class Sampler:
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks: collections.Counter = collections.Counter()
+        self.target = threading.get_ident()
+        self.done = threading.Event()
+        self.skip = 0
+
+    def stack(self, frame: Optional[FrameType]) -> list[str]:
+        frames = []
+        while frame is not None:
+            code = frame.f_code
+            frames.append(
+                label((code.co_filename, code.co_firstlineno, code.co_name))
+            )
+            frame = frame.f_back
+        return frames[::-1]
+
+    def run(self):
+        while not self.done.wait(self.interval):
+            frame = sys._current_frames().get(self.target)
+            frames = self.stack(frame)[self.skip :]
+            if frames:
+                self.stacks[";".join(frames)] += 1
+
+    def __enter__(self):
+        # leave out the frames of whoever started the sampler
+        self.skip = len(self.stack(sys._getframe(1)))
+        # the sampler needs the GIL to look at the other thread's frames
+        self.switch = sys.getswitchinterval()
+        sys.setswitchinterval(self.interval / 2)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self.done.set()
+        self.thread.join()
+        sys.setswitchinterval(self.switch)
+
+
+class Peak:
+    # traces allocations while the code runs, snapshotting them from a
+    # thread and keeping the largest snapshot; a new one is only taken once
+    # the traced total has grown by a tenth, so they cost little more than
+    # one would
+    def __init__(
+        self, frames: int = 25, interval: float = 0.001, growth: float = 1.1
+    ):
+        self.frames = frames
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.size = 0
+        # what the snapshot kept takes up itself, which is traced too
+        self.overhead = 0
+        self.done = threading.Event()
+
+    def take(self):
+        current = tracemalloc.get_traced_memory()[0] - self.overhead
+        if self.snapshot is not None and current <= self.size * self.growth:
+            return
+        self.snapshot = None
+        before = tracemalloc.get_traced_memory()[0]
+        self.snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+            ]
+        )
+        self.overhead = tracemalloc.get_traced_memory()[0] - before
+        self.size = current
+
+    def run(self):
+        while not self.done.wait(self.interval):
+            if tracemalloc.is_tracing():
+                self.take()
+
+    def __enter__(self):
+        self.switch = sys.getswitchinterval()
+        sys.setswitchinterval(self.interval / 2)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        tracemalloc.start(self.frames)
+        return self
+
+    def __exit__(self, *_):
+        self.done.set()
+        self.thread.join()
+        sys.setswitchinterval(self.switch)
+        try:
+            # stages too quick to be sampled still get the state they end in
+            self.take()
+        finally:
+            tracemalloc.stop()
+
+
+def allocations(
+    f: Callable[[], Any], limit: int, reset: Callable[[], Any]
+) -> str:
+    # the peak comes from a run of its own, as snapshots are traced too
+    reset()
+    tracemalloc.start()
+    try:
+        f()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    reset()
+    with Peak() as largest:
+        f()
+
+    assert largest.snapshot is not None
+    stats = largest.snapshot.statistics("lineno")
+    lines = [
+        f"peak: {peak} bytes",
+        "allocations live at the largest snapshot taken while running: "
+        f"{sum(stat.size for stat in stats)} bytes",
+        "",
+    ]
+    for stat in stats[:limit]:
+        lines.append(str(stat))
+    return "\n".join(lines) + "\n"
+
+
+def write_collapsed(path: pathlib.Path, stacks: collections.Counter):
+    path.write_text("".join(f"{s} {n}\n" for s, n in sorted(stacks.items())))
+
+
+def profile(
+    day: int,
+    input: str,
+    stages: list[str],
+    out: pathlib.Path,
+    sample: bool,
+    sort: str,
+    limit: int,
+):
+    solver = solvers.load(day)
+    out.mkdir(parents=True, exist_ok=True)
+
+    for name in stages:
+        f = stage(solver, name, input)
+
+        solvers.reset(solver)
+        p = cProfile.Profile()
+        start = time.perf_counter()
+        p.runcall(f)
+        elapsed = time.perf_counter() - start
+        p.dump_stats(out / f"{name}.pstats")
+        (out / f"{name}.txt").write_text(report(p, sort, limit))
+
+        if sample:
+            solvers.reset(solver)
+            with Sampler() as sampler:
+                f()
+            stacks = sampler.stacks
+        else:
+            stacks = collapsed_from_profile(p)
+        write_collapsed(out / f"{name}.folded", stacks)
+
+        reset = functools.partial(solvers.reset, solver)
+        (out / f"{name}.alloc.txt").write_text(allocations(f, limit, reset))
+
+        print(
+            f"dec{day:02d} {name}: {elapsed:.3f}s under cProfile; "
+            f"reports in {out}/{name}.*",
+            file=sys.stderr,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python3 -m aoc.profiling")
+    parser.add_argument("day", type=int)
+    parser.add_argument("-i", "--input", default="input")
+    parser.add_argument(
+        "-s",
+        "--stages",
+        default=",".join(STAGES),
+        help="comma-separated stages to profile",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        help="report directory (default: decNN/profile)",
+    )
+    parser.add_argument(
+        "--sample",
+        action="store_true",
+        help="take the flame graph stacks from a sampling profiler",
+    )
+    parser.add_argument("--sort", default="tottime")
+    parser.add_argument("-n", "--limit", type=int, default=30)
+    args = parser.parse_args()
+
+    profile(
+        args.day,
+        solvers.read_input(args.day, args.input),
+        args.stages.split(","),
+        args.output or solvers.ROOT / f"dec{args.day:02d}" / "profile",
+        args.sample,
+        args.sort,
+        args.limit,
+    )
+
+
+if __name__ == "__main__":
+    main()
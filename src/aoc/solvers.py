@@ -0,0 +1,52 @@
+import importlib
+import pathlib
+from types import ModuleType
+from typing import Any, Iterable
+
+ROOT = pathlib.Path(__file__).parent.parent
+DAYS = sorted(
+    int(p.name[3:])
+    for p in ROOT.glob("dec[0-9][0-9]")
+    if (p / "solve.py").exists()
+)
+PARTS = ("a", "b")
+
+
+def module_name(day: int) -> str:
+    return f"dec{day:02d}.solve"
+
+
+def load(day: int) -> ModuleType:
+    return importlib.import_module(module_name(day))
+
+
+def reset(solver: ModuleType):
+    for f in vars(solver).values():
+        if callable(getattr(f, "cache_clear", None)):
+            f.cache_clear()
+
+
+def input_path(day: int, input: str = "input") -> pathlib.Path:
+    p = pathlib.Path(input)
+    if p.suffix:
+        return p
+    return ROOT / f"dec{day:02d}" / f"{input}.txt"
+
+
+def read_input(day: int, input: str = "input") -> str:
+    return input_path(day, input).read_text()
+
+
+def solve(
+    day: int, input: str, parts: Iterable[str] = PARTS
+) -> dict[str, Any]:
+    solver = load(day)
+    # memo caches are keyed by the model, so drop them once it is done with,
+    # or long-lived processes keep every model solved so far
+    try:
+        model = solver.parse(input)
+        return {
+            part: getattr(solver, f"part_{part}")(model) for part in parts
+        }
+    finally:
+        reset(solver)
@@ -0,0 +1,96 @@
+import platform
+import resource
+import sys
+import time
+from types import ModuleType
+from typing import Any, Iterable
+
+from aoc import solvers
+
+KB = 1024
+
+
+def reset_peak_rss():
+    # on Linux, this resets VmHWM so each stage gets its own peak
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * KB
+    except OSError:
+        pass
+
+    # ru_maxrss is the peak for the whole process; kB on Linux, B on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * KB
+
+
+def cache_stats(solver: ModuleType) -> dict[str, tuple[int, int]]:
+    return {
+        name: (info.hits, info.misses)
+        for name, f in vars(solver).items()
+        if callable(getattr(f, "cache_info", None))
+        for info in [f.cache_info()]
+    }
+
+
+def measured(solver: ModuleType, f, *args) -> tuple[Any, dict[str, Any]]:
+    before = cache_stats(solver)
+    reset_peak_rss()
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = f(*args)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    after = cache_stats(solver)
+
+    stats: dict[str, Any] = {"wall": wall, "cpu": cpu, "peak_rss": peak_rss()}
+    if after:
+        stats["caches"] = {
+            name: {
+                "hits": hits - before.get(name, (0, 0))[0],
+                "misses": misses - before.get(name, (0, 0))[1],
+            }
+            for name, (hits, misses) in after.items()
+        }
+    return result, stats
+
+
+class Recorder:
+    def __init__(self):
+        self.records: list[dict[str, Any]] = []
+        self.context: dict[str, Any] = {}
+
+    def solve(
+        self, day: int, input: str, parts: Iterable[str] = solvers.PARTS
+    ) -> dict[str, Any]:
+        solver = solvers.load(day)
+        record: dict[str, Any] = {
+            **self.context,
+            "day": day,
+            "input_bytes": len(input.encode()),
+            "host": platform.node(),
+            "python": platform.python_version(),
+            "time": time.time(),
+            "stages": {},
+        }
+
+        stages = record["stages"]
+        answers = {}
+        try:
+            model, stages["parse"] = measured(solver, solver.parse, input)
+            for part in parts:
+                solve = getattr(solver, f"part_{part}")
+                answers[part], stages[part] = measured(solver, solve, model)
+        finally:
+            solvers.reset(solver)
+
+        record["peak_rss"] = max(s["peak_rss"] for s in stages.values())
+        self.records.append(record)
+        return answers
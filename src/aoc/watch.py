@@ -0,0 +1,186 @@
+import argparse
+import importlib
+import inspect
+import os
+import pathlib
+import sys
+import time
+import traceback
+from types import CodeType, ModuleType
+from typing import Any, Iterable, Optional
+
+from aoc import cache, solvers
+from aoc.__main__ import show
+
+
+def mtime(path: pathlib.Path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def names(code: CodeType) -> Iterable[str]:
+    yield from code.co_names
+    for c in code.co_consts:
+        if isinstance(c, CodeType):
+            yield from names(c)
+
+
+def dependencies(solver: ModuleType, name: str) -> dict[str, Any]:
+    # everything at module level that `name` reaches, so that comparing
+    # before and after a reload tells whether its behaviour could change
+    found: dict[str, Any] = {}
+    todo = [name]
+    while todo:
+        n = todo.pop()
+        if n in found or not hasattr(solver, n):
+            continue
+        v = inspect.unwrap(getattr(solver, n))
+        if isinstance(v, ModuleType):
+            continue
+
+        if isinstance(v, type):
+            codes = [
+                f.__code__ for f in vars(v).values() if hasattr(f, "__code__")
+            ]
+            found[n] = (v.__qualname__, *codes)
+        elif hasattr(v, "__code__"):
+            codes = [v.__code__]
+            found[n] = v.__code__
+        else:
+            codes = []
+            found[n] = v
+
+        for code in codes:
+            todo.extend(names(code))
+
+    return found
+
+
+class Watched:
+    def __init__(self, day: int, input: pathlib.Path, parts: str):
+        self.day = day
+        self.input = input
+        self.parts = parts
+        self.solver = solvers.load(day)
+        self.text: Optional[str] = None
+        self.model: Any = None
+        self.answers: dict[str, Any] = {}
+
+    def files(self) -> set[pathlib.Path]:
+        return {self.input, *cache.sources(self.solver)}
+
+    def fingerprints(self) -> dict[str, dict[str, Any]]:
+        return {
+            name: dependencies(self.solver, name)
+            for name in ["parse", *(f"part_{part}" for part in self.parts)]
+        }
+
+    def reload(self, changed: set[pathlib.Path]) -> set[str]:
+        before = self.fingerprints()
+
+        # reload shared modules first, so the solver picks them up
+        shared = False
+        for m in set(cache.shared_modules(self.solver)):
+            if pathlib.Path(m.__file__) in changed:
+                importlib.reload(m)
+                shared = True
+
+        self.solver = importlib.reload(self.solver)
+        after = self.fingerprints()
+
+        if shared or before["parse"] != after["parse"]:
+            self.model = None
+        return {
+            part
+            for part in self.parts
+            if before[f"part_{part}"] != after[f"part_{part}"]
+        }
+
+    def run(self, stale: Iterable[str]):
+        print(f"Running dec {self.day} with {self.input.name}", flush=True)
+        if self.model is None:
+            if self.text is None:
+                self.text = self.input.read_text()
+            solvers.reset(self.solver)
+            start = time.perf_counter()
+            self.model = self.solver.parse(self.text)
+            print(f"parsed in {time.perf_counter() - start:.3f}s", flush=True)
+            stale = self.parts
+
+        for part in self.parts:
+            if part not in stale and part in self.answers:
+                answer = self.answers[part]
+                print(show(self.day, part, answer), "(unchanged)", flush=True)
+                continue
+
+            self.answers.pop(part, None)
+            solve = getattr(self.solver, f"part_{part}")
+            start = time.perf_counter()
+            answer = self.answers[part] = solve(self.model)
+            elapsed = time.perf_counter() - start
+            print(
+                show(self.day, part, answer), f"({elapsed:.3f}s)", flush=True
+            )
+
+    def update(self, changed: set[pathlib.Path]):
+        stale: set[str] = set()
+        if self.input in changed:
+            self.text, self.model = None, None
+        if changed - {self.input}:
+            stale = self.reload(changed)
+        self.run(stale)
+
+
+def watch(days: list[Watched], interval: float):
+    seen = {f: mtime(f) for d in days for f in d.files()}
+
+    for d in days:
+        try:
+            d.run(d.parts)
+        except Exception:
+            traceback.print_exc()
+
+    while True:
+        time.sleep(interval)
+        now = {f: mtime(f) for d in days for f in d.files()}
+        changed = {f for f, t in now.items() if seen.get(f) != t}
+        seen = now
+        if not changed:
+            continue
+
+        print("\033c", end="")
+        for d in days:
+            if not changed & d.files():
+                continue
+            try:
+                d.update(changed & d.files())
+            except Exception:
+                traceback.print_exc()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python3 -m aoc.watch")
+    parser.add_argument("days", nargs="+", type=int)
+    parser.add_argument("-i", "--input", default="input")
+    parser.add_argument("-p", "--parts", default="".join(solvers.PARTS))
+    parser.add_argument(
+        "--interval", type=float, default=0.2, help="seconds between polls"
+    )
+    args = parser.parse_args()
+
+    try:
+        watch(
+            [
+                Watched(day, solvers.input_path(day, args.input), args.parts)
+                for day in args.days
+            ],
+            args.interval,
+        )
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,60 @@
 #!/usr/bin/env python3
 
+import argparse
+import heapq
 import sys
+from typing import Iterable, Iterator
 
-packs = sorted(
-    (
-        sum(int(line) for line in pack.split("\n") if line.strip())
-        for pack in sys.stdin.read().split("\n\n")
-    ),
-    reverse=True,
-)
+K = 3
 
-print("a:", packs[0])
-print("b:", sum(packs[:3]))
+
+def totals(lines: Iterable[str]) -> Iterator[int]:
+    total = None
+    for line in lines:
+        if line.strip():
+            total = (total or 0) + int(line)
+        elif total is not None:
+            yield total
+            total = None
+    if total is not None:
+        yield total
+
+
+def top(totals: Iterable[int], k: int = K) -> list[int]:
+    # a min-heap of the k largest totals seen so far, so memory stays O(k)
+    heap: list[int] = []
+    for total in totals:
+        if len(heap) < k:
+            heapq.heappush(heap, total)
+        elif total > heap[0]:
+            heapq.heapreplace(heap, total)
+    return sorted(heap, reverse=True)
+
+
+def parse(input: str, k: int = K) -> list[int]:
+    return top(totals(input.splitlines()), k)
+
+
+def top_k(packs: list[int], k: int) -> int:
+    return sum(packs[:k])
+
+
+def part_a(packs: list[int]) -> int:
+    return top_k(packs, 1)
+
+
+def part_b(packs: list[int]) -> int:
+    return top_k(packs, 3)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-k", type=int, default=K, help="also sum the top k")
+    args = parser.parse_args()
+
+    # stream stdin line by line rather than reading it all up front
+    packs = top(totals(sys.stdin), max(args.k, K))
+    print("a:", part_a(packs))
+    print("b:", part_b(packs))
+    if args.k != K:
+        print(f"top {args.k}:", top_k(packs, args.k))
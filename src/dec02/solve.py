@@ -1,40 +1,66 @@
 #!/usr/bin/env python3
 
 import sys
+from typing import BinaryIO
+
+CHUNK = 1 << 20
 
-input = sys.stdin.readlines()
-moves = ["🤘", "📜", "✂️"]
 score = [3, 6, 0]
 
+Counts = list[list[int]]
+
+
+def score_round(them: int, me: int) -> int:
+    return me + 1 + score[(me - them) % 3]
+
+
+# the score for each (their move, second column) pair under either reading
+# of the second column: my move for part a, the outcome for part b
+TABLE_A = [[score_round(t, c) for c in range(3)] for t in range(3)]
+TABLE_B = [
+    [score_round(t, (t + c - 1) % 3) for c in range(3)] for t in range(3)
+]
+
+
+def count(data: bytes, counts: Counts):
+    for t, them in enumerate(b"ABC"):
+        for c, col in enumerate(b"XYZ"):
+            counts[t][c] += data.count(bytes([them, 32, col]))
+
 
-def score_round(them, me):
-    return moves.index(me) + 1 + score[(moves.index(me) - moves.index(them)) % 3]
+def parse(input: str | bytes) -> Counts:
+    if isinstance(input, str):
+        input = input.encode()
+    counts = [[0] * 3 for _ in range(3)]
+    count(input, counts)
+    return counts
 
 
-def strategy(my_move):
-    for round in input:
-        t, m = round.split()
-        them = moves["ABC".index(t.strip())]
-        me = my_move(them, m.strip())
-        yield them, me
+def stream(f: BinaryIO) -> Counts:
+    # count whole lines a chunk at a time, carrying over any partial line
+    counts = [[0] * 3 for _ in range(3)]
+    rest = b""
+    while chunk := f.read(CHUNK):
+        head, _, tail = (rest + chunk).rpartition(b"\n")
+        count(head, counts)
+        rest = tail
+    count(rest, counts)
+    return counts
 
 
-def a():
-    def my_move(them, me):
-        return {"X": "🤘", "Y": "📜", "Z": "✂️"}[me]
+def total(counts: Counts, table: Counts) -> int:
+    return sum(n * s for ns, ss in zip(counts, table) for n, s in zip(ns, ss))
 
-    total_score = sum(score_round(*round) for round in strategy(my_move))
-    print("a:", total_score)
 
+def part_a(counts: Counts) -> int:
+    return total(counts, TABLE_A)
 
-def b():
-    def my_move(them, me):
-        move = moves[(moves.index(them) + {"X": -1, "Y": 0, "Z": 1}[me]) % 3]
-        return move
 
-    total_score = sum(score_round(*round) for round in strategy(my_move))
-    print("b:", total_score)
+def part_b(counts: Counts) -> int:
+    return total(counts, TABLE_B)
 
 
-a()
-b()
+if __name__ == "__main__":
+    counts = stream(sys.stdin.buffer)
+    print("a:", part_a(counts))
+    print("b:", part_b(counts))
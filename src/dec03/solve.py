@@ -1,43 +1,60 @@
 #!/usr/bin/env python3
 
-import functools
+import array
 import string
 import sys
+from typing import Iterable
 
-input = sys.stdin.readlines()
+# one bit per item type, placed so that a mask's bit_length is the priority
+# of its highest item; masks of single items thus map straight to priority
+BIT = [0] * 256
+for p, c in enumerate(string.ascii_letters.encode(), start=1):
+    BIT[c] = 1 << (p - 1)
 
 
-def prio(item):
-    if item in string.ascii_lowercase:
-        return string.ascii_lowercase.index(item) + 1
-    else:
-        return string.ascii_uppercase.index(item) + 27
+def mask(items: bytes) -> int:
+    return sum(BIT[c] for c in set(items))
 
 
-print(
-    "a:",
-    sum(
-        prio(
-            set(rucksack[: int(len(rucksack) / 2)])
-            .intersection(set(rucksack[int(len(rucksack) / 2) :]))
-            .pop()
-        )
-        for rucksack in input
-    ),
-)
+def rucksack(line: bytes) -> tuple[int, int]:
+    half = len(line) // 2
+    return mask(line[:half]), mask(line[half:])
 
 
-def elf_groups():
-    return [
-        [set(rucksack.strip()) for rucksack in input[i : i + 3]]
-        for i in range(0, len(input), 3)
-    ]
+def parse(input: str | bytes) -> tuple[array.array, array.array]:
+    if isinstance(input, str):
+        input = input.encode()
+    lefts, rights = array.array("q"), array.array("q")
+    for line in input.split():
+        left, right = rucksack(line)
+        lefts.append(left)
+        rights.append(right)
+    return lefts, rights
 
 
-print(
-    "b:",
-    sum(
-        prio(functools.reduce(lambda a, b: a.intersection(b), group).pop())
-        for group in elf_groups()
-    ),
-)
+def part_a(rucksacks: tuple[array.array, array.array]) -> int:
+    return sum((left & right).bit_length() for left, right in zip(*rucksacks))
+
+
+def part_b(rucksacks: tuple[array.array, array.array]) -> int:
+    masks = iter([left | right for left, right in zip(*rucksacks)])
+    return sum((a & b & c).bit_length() for a, b, c in zip(*[masks] * 3))
+
+
+def stream(lines: Iterable[bytes]) -> tuple[int, int]:
+    # both parts in one pass, a group of three rucksacks at a time
+    a = b = 0
+    rucksacks = (rucksack(line.strip()) for line in lines if line.strip())
+    for group in zip(*[rucksacks] * 3):
+        badge = -1
+        for left, right in group:
+            a += (left & right).bit_length()
+            badge &= left | right
+        b += badge.bit_length()
+    return a, b
+
+
+if __name__ == "__main__":
+    a, b = stream(sys.stdin.buffer)
+    print("a:", a)
+    print("b:", b)
@@ -1,21 +1,69 @@
 #!/usr/bin/env python3
 
+import argparse
+import bisect
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc.ints import columns, ints  # noqa: E402
 
-def section(s):
-    lo, hi = s.split("-", 1)
-    return set(range(int(lo), int(hi) + 1))
+# alo, ahi, blo and bhi of every pair, as columns
+Assignments = tuple[memoryview, ...]
 
 
-def assignment(line):
-    a, b = line.strip().split(",", 1)
-    return section(a), section(b)
+def contains(alo: int, ahi: int, blo: int, bhi: int) -> bool:
+    return (alo <= blo and bhi <= ahi) or (blo <= alo and ahi <= bhi)
 
 
-assignments: list[tuple[set, set]] = [
-    assignment(line) for line in sys.stdin.readlines()
-]
+def overlaps(alo: int, ahi: int, blo: int, bhi: int) -> bool:
+    return alo <= bhi and blo <= ahi
 
-print("a:", sum(1 for a, b in assignments if a <= b or b <= a))
-print("b:", sum(1 for a, b in assignments if a.intersection(b)))
+
+def parse(input: str) -> Assignments:
+    return columns(ints(input), 4)
+
+
+def part_a(assignments: Assignments) -> int:
+    return sum(contains(*pair) for pair in zip(*assignments))
+
+
+def part_b(assignments: Assignments) -> int:
+    return sum(overlaps(*pair) for pair in zip(*assignments))
+
+
+class Index:
+    # every elf's range, with sorted endpoints so that the ranges covering a
+    # section can be counted with two bisections; elf i is in pair i // 2
+    def __init__(self, assignments: Assignments):
+        alo, ahi, blo, bhi = assignments
+        self.los = [lo for pair in zip(alo, blo) for lo in pair]
+        self.his = [hi for pair in zip(ahi, bhi) for hi in pair]
+        self.order = sorted(range(len(self.los)), key=self.los.__getitem__)
+        self.starts = sorted(self.los)
+        self.ends = sorted(self.his)
+
+    def count(self, section: int) -> int:
+        started = bisect.bisect_right(self.starts, section)
+        return started - bisect.bisect_left(self.ends, section)
+
+    def covering(self, section: int) -> list[int]:
+        started = self.order[: bisect.bisect_right(self.starts, section)]
+        return sorted(i for i in started if self.his[i] >= section)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "sections", nargs="*", type=int, help="count the elves covering these"
+    )
+    args = parser.parse_args()
+
+    assignments = parse(sys.stdin.read())
+    print("a:", part_a(assignments))
+    print("b:", part_b(assignments))
+
+    if args.sections:
+        index = Index(assignments)
+        for section in args.sections:
+            print(f"section {section}:", index.count(section))
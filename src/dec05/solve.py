@@ -1,50 +1,86 @@
 #!/usr/bin/env python3
 
-import re
+import pathlib
 import sys
+from typing import Iterable
 
-input = sys.stdin.read().split("\n\n")
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc.ints import columns, ints  # noqa: E402
 
+# stack i + 1 as a bytearray of crates, bottom first
+Stacks = list[bytearray]
 
-def parse_stacks():
-    n_stacks = len(input[0].splitlines()[-1].split())
-    stacks = {i: [] for i in range(1, n_stacks + 1)}
 
-    for line in input[0].splitlines():
-        for i in range(0, n_stacks * 4, 4):
-            if line[i] == "[":
-                stacks[(i / 4) + 1].append(line[i + 1])
+def parse_stacks(drawing: str) -> Stacks:
+    lines = drawing.splitlines()
+    stacks = [bytearray() for _ in lines[-1].split()]
 
-    for i in stacks:
-        stacks[i].reverse()
+    for line in reversed(lines[:-1]):
+        for i, crate in enumerate(line[1::4]):
+            if crate != " ":
+                stacks[i].append(ord(crate))
 
     return stacks
 
 
-def parse_instructions():
-    rx = re.compile(r"^move (\d+) from (\d+) to (\d+)$")
+def parse_instructions(procedure: str) -> tuple[memoryview, ...]:
+    # n, src and dst of every "move n from src to dst", as columns
+    return columns(ints(procedure), 3)
 
-    return [
-        tuple(int(g) for g in rx.fullmatch(instruction).groups())
-        for instruction in input[1].splitlines()
-    ]
 
+def parse(input: str):
+    drawing, procedure = input.split("\n\n")
+    return parse_stacks(drawing), parse_instructions(procedure)
 
-def word(stacks):
-    return "".join(
-        v for _, v in sorted((i, stack.pop()) for i, stack in stacks.items())
-    )
 
+def move(stacks: Stacks, n: int, src: int, dst: int, one_by_one: bool):
+    # in place: the source shrinks with del rather than being re-sliced
+    s, d = stacks[src - 1], stacks[dst - 1]
+    d += s[: -n - 1 : -1] if one_by_one else s[-n:]
+    del s[-n:]
 
-def solve(one_by_one):
-    stacks, instructions = parse_stacks(), parse_instructions()
-    for n, src, dst in instructions:
-        stacks[dst].extend(
-            reversed(stacks[src][-n:]) if one_by_one else stacks[src][-n:]
-        )
-        stacks[src] = stacks[src][:-n]
+
+def word(stacks: Stacks) -> str:
+    return "".join(chr(stack[-1]) for stack in stacks if stack)
+
+
+def solve(problem, one_by_one):
+    stacks, instructions = problem
+    stacks = [bytearray(stack) for stack in stacks]
+    for n, src, dst in zip(*instructions):
+        move(stacks, n, src, dst, one_by_one)
     return word(stacks)
 
 
-print("a:", solve(one_by_one=True))
-print("b:", solve(one_by_one=False))
+def part_a(problem):
+    return solve(problem, one_by_one=True)
+
+
+def part_b(problem):
+    return solve(problem, one_by_one=False)
+
+
+def stream(lines: Iterable[str]) -> tuple[str, str]:
+    # both cranes side by side, one instruction line at a time
+    lines = iter(lines)
+    drawing = []
+    for line in lines:
+        if not line.strip():
+            break
+        drawing.append(line)
+
+    a = parse_stacks("".join(drawing))
+    b = [bytearray(stack) for stack in a]
+    for line in lines:
+        if not line.strip():
+            continue
+        _, n, _, src, _, dst = line.split()
+        move(a, int(n), int(src), int(dst), one_by_one=True)
+        move(b, int(n), int(src), int(dst), one_by_one=False)
+    return word(a), word(b)
+
+
+if __name__ == "__main__":
+    a, b = stream(sys.stdin)
+    print("a:", a)
+    print("b:", b)
@@ -1,15 +1,81 @@
 #!/usr/bin/env python3
 
+import argparse
 import sys
+from typing import Iterable
 
-input = sys.stdin.read().strip()
+CHUNK = 1 << 16
+WHITESPACE = b" \t\r\n"
 
 
-def find_marker(problem, n):
-    for i in range(n - 1, len(problem)):
-        if len(set(problem[i - n : i])) == n:
-            return i
+class Detector:
+    # tracks the longest run of distinct characters ending at the current
+    # position via each character's last-seen index; a marker of size n ends
+    # where that run first reaches n, so every size is found in one pass
+    def __init__(self, sizes: Iterable[int]):
+        self.pending = sorted(set(sizes))
+        self.markers: dict[int, int] = {}
+        self.last = [-1] * 256
+        self.start = 0
+        self.offset = 0
 
+    @property
+    def done(self) -> bool:
+        return not self.pending
 
-print("a:", find_marker(input, 4))
-print("b:", find_marker(input, 14))
+    def feed(self, chunk: bytes):
+        data = chunk.translate(None, WHITESPACE)
+        last, start, pending = self.last, self.start, self.pending
+        for i, c in enumerate(data, self.offset):
+            if last[c] >= start:
+                start = last[c] + 1
+            last[c] = i
+            while pending and i - start + 1 >= pending[0]:
+                self.markers[pending.pop(0)] = i + 1
+            if not pending:
+                break
+        self.start = start
+        self.offset += len(data)
+
+
+def parse(input: str | bytes) -> bytes:
+    if isinstance(input, str):
+        input = input.encode()
+    return input.strip()
+
+
+def find_markers(problem: bytes, sizes: Iterable[int]) -> dict[int, int]:
+    detector = Detector(sizes)
+    detector.feed(problem)
+    return detector.markers
+
+
+def part_a(problem: bytes):
+    return find_markers(problem, [4]).get(4)
+
+
+def part_b(problem: bytes):
+    return find_markers(problem, [14]).get(14)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "sizes",
+        nargs="*",
+        type=int,
+        help="find markers of these sizes rather than those of both parts",
+    )
+    args = parser.parse_args()
+
+    sizes = args.sizes
+    detector = Detector(sizes or [4, 14])
+    while not detector.done and (chunk := sys.stdin.buffer.read(CHUNK)):
+        detector.feed(chunk)
+
+    if sizes:
+        for n in sizes:
+            print(f"{n}:", detector.markers.get(n))
+    else:
+        print("a:", detector.markers.get(4))
+        print("b:", detector.markers.get(14))
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 
+import array
+import bisect
 import dataclasses
+import itertools
 import sys
-from typing import Optional
-
-input = sys.stdin.readlines()
+from typing import Iterable, Optional
 
 
 @dataclasses.dataclass(frozen=True)
@@ -20,108 +21,84 @@ class Dir:
     dirs: list["Dir"] = dataclasses.field(default_factory=list)
 
 
-def parse() -> Dir:
-    def is_cd(line: str) -> bool:
-        return line.strip()[:4] == "$ cd"
-
-    def is_cd_up(line: str) -> bool:
-        return line.strip() == "$ cd .."
-
-    def is_dir(line: str) -> bool:
-        return line.strip()[:3] == "dir"
-
-    def is_file(line: str) -> bool:
-        return line.strip().split()[0].isnumeric()
-
-    def dir(input: list[str]) -> tuple[Dir, list[str]]:
-        assert is_cd(input[0]), input[0]
-        assert not is_cd_up(input[0]), input[0]
-
-        name = input[0].strip().split()[-1]
-        files, dirs, rest = listing(input[1:])
-
-        assert not rest or is_cd_up(rest[0]), rest[0]
-
-        return Dir(name, files, dirs), rest[1:]
-
-    def listing(input: list[str]) -> tuple[list[File], list[Dir], list[str]]:
-        assert input[0].strip()[:4] == "$ ls", input[0]
-        files, dirs, rest = contents(input[1:])
-
-        if not rest or is_cd_up(rest[0]):
-            return files, dirs, rest
-
-        d, rest = dir(rest)
-        return files, [d, *dirs], rest
-
-    def contents(input: list[str]) -> tuple[list[File], list[Dir], list[str]]:
-        if not input:
-            return [], [], []
-
-        if is_cd_up(input[0]):
-            return [], [], input
-
-        if is_cd(input[0]):
-            d, rest = dir(input)
-            files, dirs, rest = contents(rest)
-            return files, [d, *dirs], rest
-
-        if is_dir(input[0]):
-            return contents(input[1:])
+def build(lines: Iterable[str]) -> Dir:
+    # one pass over the transcript, with the path to the current directory
+    # kept on an explicit stack
+    root = Dir("/")
+    path = [root]
+    for line in lines:
+        words = line.split()
+        if not words or words[:2] == ["$", "ls"] or words[0] == "dir":
+            continue
+
+        if words[:2] == ["$", "cd"]:
+            if words[2] == "/":
+                del path[1:]
+            elif words[2] == "..":
+                path.pop()
+            else:
+                d = Dir(words[2])
+                path[-1].dirs.append(d)
+                path.append(d)
+        elif words[0].isnumeric():
+            path[-1].files.append(File(words[1], int(words[0])))
+        else:
+            raise Exception(f"not handled: {line.strip()}")
+
+    return root
+
+
+class Sizes:
+    # the cumulative size of every directory, indexed by id in breadth-first
+    # order so that a parent's id is always below its children's, plus the
+    # sizes sorted with prefix sums for answering queries by bisection
+    def __init__(self, tree: Dir):
+        dirs = [tree]
+        parents = array.array("q", [-1])
+        for i, d in enumerate(dirs):
+            dirs.extend(d.dirs)
+            parents.extend([i] * len(d.dirs))
+
+        self.totals = array.array(
+            "q", (sum(f.size for f in d.files) for d in dirs)
+        )
+        for i in range(len(dirs) - 1, 0, -1):
+            self.totals[parents[i]] += self.totals[i]
 
-        if is_file(input[0]):
-            size, name = input[0].strip().split()
-            f, d, rest = contents(input[1:])
-            return [File(name, int(size)), *f], d, rest
+        self.sorted = array.array("q", sorted(self.totals))
+        self.prefix = array.array(
+            "q", itertools.accumulate(self.sorted, initial=0)
+        )
 
-        raise Exception(f"not handled: {input[0]}")
+    def total(self) -> int:
+        return self.totals[0]
 
-    return dir(input)[0]
+    def sum_at_most(self, cap: int) -> int:
+        return self.prefix[bisect.bisect_right(self.sorted, cap)]
 
+    def smallest_at_least(self, n: int) -> Optional[int]:
+        i = bisect.bisect_left(self.sorted, n)
+        return self.sorted[i] if i < len(self.sorted) else None
 
-def size(d: Dir) -> int:
-    return sum(f.size for f in d.files) + sum(size(sd) for sd in d.dirs)
 
+def parse(input: str) -> Sizes:
+    return Sizes(build(input.splitlines()))
 
-def a():
-    def capped_size(d: Dir, cap=100_000) -> int:
-        file_size = sum(f.size for f in d.files)
-        subdir_size = sum(size(sd) for sd in d.dirs)
-        capped_subdir_size = sum(capped_size(sd) for sd in d.dirs)
-        return (
-            file_size + subdir_size + capped_subdir_size
-            if file_size + subdir_size <= cap
-            else capped_subdir_size
-        )
 
-    return capped_size(parse())
+def part_a(sizes: Sizes) -> int:
+    return sizes.sum_at_most(100_000)
 
 
-def b():
+def part_b(sizes: Sizes) -> Optional[int]:
     capacity = 70000000
     required = 30000000
-    tree = parse()
-
-    total_size = size(tree)
-    free = capacity - total_size
-    missing = required - free
-
-    def smallest_large_enough(d: Dir) -> Optional[int]:
-        valid_subdir = min(
-            (sd for sd in map(smallest_large_enough, d.dirs) if sd),
-            default=None,
-        )
-        if valid_subdir:
-            return valid_subdir
-
-        s = size(d)
-        if s >= missing:
-            return s
-
-        return None
 
-    return smallest_large_enough(tree)
+    free = capacity - sizes.total()
+    # deleting an empty directory frees nothing, even if nothing is missing
+    return sizes.smallest_at_least(max(required - free, 1))
 
 
-print("a:", a())
-print("b:", b())
+if __name__ == "__main__":
+    sizes = Sizes(build(sys.stdin))
+    print("a:", part_a(sizes))
+    print("b:", part_b(sizes))
@@ -1,110 +1,116 @@
 #!/usr/bin/env python3
 
-import itertools
+import argparse
+import array
+import concurrent.futures
+import contextlib
+import functools
+import operator
+import pathlib
 import sys
-
-
-input = sys.stdin.readlines()
-
-forest = {
-    (x, y): int(h)
-    for y, line in enumerate(input)
-    for x, h in enumerate(line.strip())
-}
-xhi, yhi = max(x for x, _ in forest.keys()), max(y for y, _ in forest.keys())
-
-
-def show(forest: dict[tuple[int, int], int]):
-    for y in range(yhi + 1):
-        print("".join(str(forest[(x, y)]) for x in range(xhi + 1)))
-
-
-def a():
-    mapped = {}
-
-    # map highest to the left of
-    for y in range(yhi + 1):
-        hi = -1
-        for x in range(xhi + 1):
-            h = forest.get((x - 1, y), -1)
-            hi = max(h, hi)
-            mapped[(x, y)] = {"l": hi}
-    # map highest to the right of
-    for y in range(yhi + 1):
-        hi = -1
-        for x in range(xhi, -1, -1):
-            h = forest.get((x + 1, y), -1)
-            hi = max(h, hi)
-            mapped[(x, y)]["r"] = hi
-    # map highest above
-    for x in range(xhi + 1):
-        hi = -1
-        for y in range(yhi + 1):
-            h = forest.get((x, y - 1), -1)
-            hi = max(h, hi)
-            mapped[(x, y)]["u"] = hi
-    # map highest below
-    for x in range(xhi + 1):
-        hi = -1
-        for y in range(yhi, -1, -1):
-            h = forest.get((x, y + 1), -1)
-            hi = max(h, hi)
-            mapped[(x, y)]["d"] = hi
-
-    return sum(
-        1
-        for p in forest.keys()
-        if forest[p] > mapped[p]["l"]
-        or forest[p] > mapped[p]["r"]
-        or forest[p] > mapped[p]["u"]
-        or forest[p] > mapped[p]["d"]
+from typing import Iterator
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc.grid import Grid  # noqa: E402
+
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def parse(input: str) -> Grid:
+    # translating the digits in one go is much faster than int() per tree
+    lines = input.split()
+    cells = array.array("b", "".join(lines).encode().translate(DIGITS))
+    return Grid(len(lines[0]), len(lines), cells=cells)
+
+
+def show(forest: Grid):
+    for y in range(forest.height):
+        print("".join(map(str, forest.row(y))))
+
+
+def visible(trees: bytes) -> Iterator[int]:
+    # seen from either end, the running maximum only steps up at the first
+    # tree of each height, so with heights 0-9 at most ten trees per end are
+    # visible, and bytes.find locates them without a loop over the line
+    first, last = len(trees), -1
+    for h in range(9, -1, -1):
+        i, j = trees.find(h), trees.rfind(h)
+        if 0 <= i < first:
+            first = i
+            yield i
+        if j > last:
+            last = j
+            yield j
+
+
+def part_a(forest: Grid) -> int:
+    w = forest.width
+    seen = set()
+    for y in range(forest.height):
+        seen.update(y * w + x for x in visible(forest.row(y).tobytes()))
+    for x in range(w):
+        seen.update(y * w + x for y in visible(forest.column(x).tobytes()))
+    return len(seen)
+
+
+def viewing_distances(trees: bytes) -> list[int]:
+    # looking back towards the start of the line; the stack holds the trees
+    # that could still block the view, tallest at the bottom, so every tree
+    # is pushed and popped at most once
+    distances = []
+    blocking: list[int] = []
+    for i, h in enumerate(trees):
+        while blocking and trees[blocking[-1]] < h:
+            blocking.pop()
+        distances.append(i - blocking[-1] if blocking else i)
+        blocking.append(i)
+    return distances
+
+
+def line_scores(trees: bytes) -> array.array:
+    back = viewing_distances(trees)
+    ahead = reversed(viewing_distances(trees[::-1]))
+    return array.array("q", map(operator.mul, back, ahead))
+
+
+def scenic_scores(forest: Grid, workers: int = 1) -> Grid:
+    rows = [forest.row(y).tobytes() for y in range(forest.height)]
+    columns = [forest.column(x).tobytes() for x in range(forest.width)]
+
+    with contextlib.ExitStack() as stack:
+        map_ = map
+        if workers > 1:
+            pool = stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+            )
+            chunk = max(1, len(rows) // (workers * 4))
+            map_ = functools.partial(pool.map, chunksize=chunk)
+
+        scores = Grid(forest.width, forest.height, "q")
+        for y, across in enumerate(map_(line_scores, rows)):
+            scores.row(y)[:] = across
+        for x, along in enumerate(map_(line_scores, columns)):
+            column = scores.column(x)
+            column[:] = array.array("q", map(operator.mul, column, along))
+
+    return scores
+
+
+def part_b(forest: Grid, workers: int = 1) -> int:
+    return max(scenic_scores(forest, workers).cells)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="score rows and columns in this many processes",
     )
+    args = parser.parse_args()
 
-
-def b():
-    mapped = {}
-
-    # looking left
-    for y in range(yhi + 1):
-        for x in range(xhi + 1):
-            distance = 0
-            for n in range(x - 1, -1, -1):
-                distance += 1
-                if forest[(n, y)] >= forest[(x, y)]:
-                    break
-            mapped[(x, y)] = {"l": distance}
-
-    # looking right
-    for y in range(yhi + 1):
-        for x in range(xhi, -1, -1):
-            distance = 0
-            for n in range(x + 1, xhi + 1):
-                distance += 1
-                if forest[(n, y)] >= forest[(x, y)]:
-                    break
-            mapped[(x, y)]["r"] = distance
-
-    # looking up
-    for x in range(xhi + 1):
-        for y in range(yhi + 1):
-            distance = 0
-            for n in range(y + 1, yhi + 1):
-                distance += 1
-                if forest[(x, n)] >= forest[(x, y)]:
-                    break
-            mapped[(x, y)]["u"] = distance
-
-    # looking down
-    for x, y in itertools.product(range(xhi + 1), range(yhi, -1, -1)):
-        distance = 0
-        for n in range(y - 1, -1, -1):
-            distance += 1
-            if forest[(x, n)] >= forest[(x, y)]:
-                break
-        mapped[(x, y)]["d"] = distance
-
-    return max(v["l"] * v["r"] * v["u"] * v["d"] for v in mapped.values())
-
-
-print("a:", a())
-print("b:", b())
+    forest = parse(sys.stdin.read())
+    print("a:", part_a(forest))
+    print("b:", part_b(forest, args.workers))
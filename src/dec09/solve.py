@@ -1,108 +1,260 @@
 #!/usr/bin/env python3
 
+import argparse
+import array
+import bisect
+import collections
+import math
+import pathlib
 import sys
+from typing import Iterable, Optional
 
-instructions = [
-    (d, int(s))
-    for d, s in map(lambda line: line.strip().split(), sys.stdin.readlines())
-]
-
-
-def sgn(x):
-    if x < 0:
-        return -1
-    if x > 0:
-        return 1
-    return 0
-
-
-def move(state, dim, d):
-    return tuple(x + d if i == dim else x for i, x in enumerate(state))
-
-
-def a():
-    state = {"H": (0, 0), "T": (0, 0), "seen": set()}
-
-    def move_head(dir):
-        match dir:
-            case "L":
-                state["H"] = move(state["H"], 0, -1)
-            case "R":
-                state["H"] = move(state["H"], 0, 1)
-            case "U":
-                state["H"] = move(state["H"], 1, 1)
-            case "D":
-                state["H"] = move(state["H"], 1, -1)
-            case _:
-                assert False, f"unsupported instruction {instruction}"
-
-    def move_tail():
-        if (
-            abs(state["H"][0] - state["T"][0]) <= 1
-            and abs(state["H"][1] - state["T"][1]) <= 1
-        ):
-            return
-
-        state["T"] = move(state["T"], 0, -sgn(state["T"][0] - state["H"][0]))
-        state["T"] = move(state["T"], 1, -sgn(state["T"][1] - state["H"][1]))
-        state["seen"].add(state["T"])
-
-    def step(instruction):
-        match instruction:
-            case dir, d:
-                for _ in range(d):
-                    move_head(dir)
-                    move_tail()
-            case _:
-                assert False, "unsupported instruction " + instruction
-
-    state["seen"].add(state["T"])
-
-    for instruction in instructions:
-        step(instruction)
-
-    return len(state["seen"])
-
-
-def b():
-    state = {i: (0, 0) for i in range(10)}
-    state["seen"] = set()
-
-    def move_head(d):
-        match d:
-            case "L":
-                state[0] = move(state[0], 0, -1)
-            case "R":
-                state[0] = move(state[0], 0, 1)
-            case "U":
-                state[0] = move(state[0], 1, 1)
-            case "D":
-                state[0] = move(state[0], 1, -1)
-
-    def move_knot(i):
-        assert 0 < i and i < 10, "invalid knot"
-
-        if (
-            abs(state[i][0] - state[i - 1][0]) <= 1
-            and abs(state[i][1] - state[i - 1][1]) <= 1
-        ):
-            return
-
-        state[i] = move(state[i], 0, sgn(state[i - 1][0] - state[i][0]))
-        state[i] = move(state[i], 1, sgn(state[i - 1][1] - state[i][1]))
-
-    def step(d):
-        move_head(d)
-        for i in range(1, 10):
-            move_knot(i)
-        state["seen"].add(state[9])
-
-    for d, n in instructions:
-        for _ in range(n):
-            step(d)
-
-    return len(state["seen"])
-
-
-print("a:", a())
-print("b:", b())
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc.ints import ints  # noqa: E402
+
+# the direction letters, in order, and how far to go in each
+Instructions = tuple[str, array.array]
+
+
+def parse(input: str) -> Instructions:
+    data = input.encode()
+    return data.translate(None, b"0123456789 \t\r\n").decode(), ints(data)
+
+
+DIRECTIONS = {"L": (-1, 0), "R": (1, 0), "U": (0, 1), "D": (0, -1)}
+
+Run = tuple[int, int]
+
+# the ends of a line's runs as two columns, so that they are held without an
+# object per run
+Runs = tuple[array.array, array.array]
+
+
+def runs() -> Runs:
+    return array.array("q"), array.array("q")
+
+
+def merge(runs: Runs) -> list[Run]:
+    merged: list[Run] = []
+    for lo, hi in sorted(zip(*runs)):
+        if merged and lo <= merged[-1][1] + 1:
+            if hi > merged[-1][1]:
+                merged[-1] = (merged[-1][0], hi)
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def covers(runs: list[Run], v: int) -> bool:
+    i = bisect.bisect_right(runs, (v, math.inf)) - 1
+    return i >= 0 and runs[i][1] >= v
+
+
+def crossings(
+    rows: dict[int, list[Run]], columns: dict[int, list[Run]]
+) -> int:
+    # single cells are looked up in their column directly; for longer runs,
+    # sweep left to right with the rows of the horizontal runs under way in
+    # a Fenwick tree, so each vertical run counts the ones it crosses in
+    # O(log n); runs end after the vertical runs at the same x are counted
+    total = 0
+    events = []
+    for y, runs in rows.items():
+        for lo, hi in runs:
+            if lo == hi:
+                total += lo in columns and covers(columns[lo], y)
+            else:
+                events.extend(((lo, 0, y, 0), (hi, 2, y, 0)))
+
+    ys = sorted({y for _, _, y, _ in events})
+    index = {y: i + 1 for i, y in enumerate(ys)}
+    events.extend(
+        (x, 1, lo, hi) for x, runs in columns.items() for lo, hi in runs
+    )
+    events.sort()
+
+    tree = [0] * (len(ys) + 1)
+
+    def update(i: int, d: int):
+        while i < len(tree):
+            tree[i] += d
+            i += i & -i
+
+    def under(i: int) -> int:
+        total = 0
+        while i:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    for _, kind, a, b in events:
+        if kind == 1:
+            lo, hi = bisect.bisect_left(ys, a), bisect.bisect_right(ys, b)
+            total += under(hi) - under(lo)
+        else:
+            update(index[a], 1 if kind == 0 else -1)
+    return total
+
+
+class Visited:
+    # visited cells as inclusive runs, horizontal ones indexed by row and
+    # vertical ones by column; cells added next to the run under way extend
+    # it, so a straight stretch of any length is recorded in O(1)
+    def __init__(self):
+        self.rows: dict[int, Runs] = collections.defaultdict(runs)
+        self.columns: dict[int, Runs] = collections.defaultdict(runs)
+        self.limits: dict[tuple[bool, int], int] = {}
+        # horizontal or not, the row or column, and the ends
+        self.run: Optional[tuple[bool, int, int, int]] = None
+
+    def store(self, horizontal: bool, line: int, lo: int, hi: int):
+        los, his = (self.rows if horizontal else self.columns)[line]
+        los.append(lo)
+        his.append(hi)
+        # merge now and then, so revisits don't pile up duplicate runs
+        limit = self.limits.get((horizontal, line), 16)
+        if len(los) >= limit:
+            merged = merge((los, his))
+            los[:] = array.array("q", (lo for lo, _ in merged))
+            his[:] = array.array("q", (hi for _, hi in merged))
+            self.limits[horizontal, line] = max(16, 2 * len(los))
+
+    def extend(self, horizontal: bool, line: int, lo: int, hi: int):
+        if self.run is not None:
+            same = self.run[:2] == (horizontal, line)
+            _, _, rlo, rhi = self.run
+            if same and lo <= rhi + 1 and rlo <= hi + 1:
+                self.run = (horizontal, line, min(lo, rlo), max(hi, rhi))
+                return
+            self.store(*self.run)
+        self.run = (horizontal, line, lo, hi)
+
+    def add(self, x: int, y: int):
+        run = self.run
+        if run is not None:
+            horizontal, line, lo, hi = run
+            if horizontal and y == line and lo - 1 <= x <= hi + 1:
+                if not lo <= x <= hi:
+                    self.run = (True, y, min(lo, x), max(hi, x))
+                return
+            if not horizontal and x == line and lo - 1 <= y <= hi + 1:
+                if not lo <= y <= hi:
+                    self.run = (False, x, min(lo, y), max(hi, y))
+                return
+            # a single cell can still turn into a vertical run
+            if horizontal and lo == hi == x and abs(y - line) == 1:
+                self.run = (False, x, min(y, line), max(y, line))
+                return
+            self.store(*run)
+        self.run = (True, y, x, x)
+
+    def add_run(self, x: int, y: int, dx: int, dy: int, n: int):
+        # the n cells after (x, y) in direction (dx, dy)
+        if dy == 0:
+            self.extend(True, y, *sorted((x + dx, x + n * dx)))
+        else:
+            self.extend(False, x, *sorted((y + dy, y + n * dy)))
+
+    def __len__(self) -> int:
+        if self.run is not None:
+            self.store(*self.run)
+            self.run = None
+
+        rows = {y: merge(runs) for y, runs in self.rows.items()}
+        columns = {x: merge(runs) for x, runs in self.columns.items()}
+        total = sum(
+            hi - lo + 1
+            for runs in (*rows.values(), *columns.values())
+            for lo, hi in runs
+        )
+        # the cells on both a horizontal and a vertical run count once
+        return total - crossings(rows, columns)
+
+
+def straight(xs: array.array, ys: array.array, dx: int, dy: int) -> bool:
+    # every knot right behind the one ahead of it, along the move
+    return all(
+        xs[i - 1] - xs[i] == dx and ys[i - 1] - ys[i] == dy
+        for i in range(1, len(xs))
+    )
+
+
+def simulate(
+    instructions: Instructions, knots: Iterable[int]
+) -> dict[int, int]:
+    # the first k knots of a longer rope move just like a rope of k knots,
+    # so one rope as long as the longest serves every requested length
+    knots = sorted(set(knots))
+    n = knots[-1]
+    xs, ys = array.array("q", [0] * n), array.array("q", [0] * n)
+    visited = {k: Visited() for k in knots}
+    for cells in visited.values():
+        cells.add(0, 0)
+    # the tails' positions and how to record them, for the hot loop
+    tails = [(k, k - 1, visited[k].add) for k in knots]
+
+    for d, steps in zip(*instructions):
+        dx, dy = DIRECTIONS[d]
+        moved = n
+        while steps:
+            # once the rope lies straight along the move, every knot just
+            # follows the head, so the rest of the move is one run per tail;
+            # a straight rope moves all its knots on the next step, so only
+            # check after such steps, and not when stepping is as cheap
+            if moved == n and steps > n and straight(xs, ys, dx, dy):
+                for k in knots:
+                    visited[k].add_run(xs[k - 1], ys[k - 1], dx, dy, steps)
+                for i in range(n):
+                    xs[i] += steps * dx
+                    ys[i] += steps * dy
+                break
+
+            steps -= 1
+            xs[0] += dx
+            ys[0] += dy
+
+            # once a knot stays put, so do all the knots behind it
+            moved = n
+            for i in range(1, n):
+                ddx, ddy = xs[i - 1] - xs[i], ys[i - 1] - ys[i]
+                if -1 <= ddx <= 1 and -1 <= ddy <= 1:
+                    moved = i
+                    break
+                xs[i] += (ddx > 0) - (ddx < 0)
+                ys[i] += (ddy > 0) - (ddy < 0)
+
+            for k, tail, add in tails:
+                if k > moved:
+                    break
+                add(xs[tail], ys[tail])
+
+    return {k: len(cells) for k, cells in visited.items()}
+
+
+def part_a(instructions: Instructions) -> int:
+    return simulate(instructions, [2])[2]
+
+
+def part_b(instructions: Instructions) -> int:
+    return simulate(instructions, [10])[10]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-k",
+        "--knots",
+        type=int,
+        nargs="+",
+        help="also count the cells visited by the tails of these ropes",
+    )
+    args = parser.parse_args()
+
+    instructions = parse(sys.stdin.read())
+    if args.knots:
+        for k, visited in sorted(simulate(instructions, args.knots).items()):
+            print(f"{k} knots:", visited)
+    else:
+        visited = simulate(instructions, [2, 10])
+        print("a:", visited[2])
+        print("b:", visited[10])
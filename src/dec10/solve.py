@@ -1,56 +1,124 @@
 #!/usr/bin/env python3
 
+import argparse
+import array
+import itertools
+import operator
 import sys
+from typing import Iterable, Iterator
 
-instructions = [tuple(line.strip().split()) for line in sys.stdin.readlines()]
+NOOP, ADDX = 0, 1
 
+# opcodes and operands, side by side
+Program = tuple[array.array, array.array]
 
-def step(state):
-    match instructions[state["p"]]:
-        case ("noop",):
-            yield {
-                **state,
-                "t": state["t"] + 1,
-                "p": (state["p"] + 1) % len(instructions),
-            }
-        case ("addx", V):
-            yield {**state, "t": state["t"] + 1}
-            yield {
-                **state,
-                "t": state["t"] + 2,
-                "x": state["x"] + int(V),
-                "p": (state["p"] + 1) % len(instructions),
-            }
 
+def parse(input: str) -> Program:
+    ops, args = array.array("b"), array.array("q")
+    for line in input.splitlines():
+        match line.split():
+            case ["noop"]:
+                ops.append(NOOP)
+                args.append(0)
+            case ["addx", v]:
+                ops.append(ADDX)
+                args.append(int(v))
+            case []:
+                continue
+            case _:
+                raise Exception(f"not handled: {line.strip()}")
+    return ops, args
 
-def loop(signal, stops):
-    stops = list(stops)
-    state = {"x": 1, "t": 1, "p": 0}
 
-    def emit_signal(s):
-        if stops and s["t"] == stops[0]:
-            yield signal(s)
-            stops.remove(stops[0])
+def run(program: Program) -> tuple[array.array, int]:
+    # X during each cycle of one pass over the program, relative to X at the
+    # start of the pass, and how much the pass changes X by
+    xs = array.array("q")
+    x = 0
+    for op, arg in zip(*program):
+        if op == ADDX:
+            xs.append(x)
+            xs.append(x)
+            x += arg
+        else:
+            xs.append(x)
+    return xs, x
 
-    while stops and state["t"] < stops[-1]:
-        for s in step(state):
-            yield from emit_signal(s)
-        state = s
 
+def trace(program: Program, cycles: int) -> array.array:
+    # X during every cycle up to and including `cycles`, indexed by cycle;
+    # the program loops, and every pass shifts X by the same amount
+    one, shift = run(program)
+    if not one:
+        raise ValueError("empty program")
+    xs = array.array("q", [1])
+    x = 1
+    while len(xs) <= cycles:
+        xs.extend(map(operator.add, one, itertools.repeat(x)))
+        x += shift
+    del xs[cycles + 1 :]
+    return xs
 
-def pixel(s):
-    y, x = divmod(s["t"] - 1, 40)
-    return (x, y), abs(s["x"] - x) < 2
 
+def signal_strength(xs: array.array, probes: Iterable[int]) -> int:
+    return sum(t * xs[t] for t in probes)
 
-def draw_crt():
-    pixelmap = {p: lit for p, lit in loop(pixel, range(2, 241))}
-    pixelmap[0, 0] = True
+
+WIDTH, HEIGHT = 40, 6
+
+# the sprite covers the pixel if X is within one of the pixel's column
+LIT = frozenset((-1, 0, 1))
+PIXELS = bytes.maketrans(b"\0\1", b".#")
+
+
+def render(
+    xs: array.array, width: int = WIDTH, height: int = HEIGHT
+) -> Iterator[bytearray]:
+    # one framebuffer of a byte per pixel for every width * height cycles,
+    # filled a frame at a time by mapping over the trace and pixel columns
+    size = width * height
+    columns = array.array("q", range(width)) * height
+    for start in range(1, len(xs), size):
+        offsets = map(operator.sub, xs[start : start + size], columns)
+        frame = bytearray(size)
+        pixels = bytes(map(LIT.__contains__, offsets))
+        frame[: len(pixels)] = pixels
+        yield frame
+
+
+def show(frame: bytearray, width: int = WIDTH) -> str:
+    pixels = frame.translate(PIXELS).decode()
     return "\n".join(
-        "".join("#" if pixelmap[(x, y)] else "." for x in range(40))
-        for y in range(6)
+        pixels[i : i + width] for i in range(0, len(pixels), width)
     )
 
 
-print("a:", sum(loop(lambda s: s["x"] * s["t"], range(20, 221, 40))))
-print("b:", draw_crt(), sep="\n")
+def draw_crt(xs: array.array, width: int = WIDTH, height: int = HEIGHT):
+    return show(next(render(xs, width, height)), width)
+
+
+def part_a(program: Program) -> int:
+    return signal_strength(trace(program, 220), range(20, 221, 40))
+
+
+def part_b(program: Program) -> str:
+    return draw_crt(trace(program, WIDTH * HEIGHT))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--width", type=int, default=WIDTH)
+    parser.add_argument("--height", type=int, default=HEIGHT)
+    parser.add_argument(
+        "--frames", type=int, help="render this many frames in a row"
+    )
+    args = parser.parse_args()
+
+    program = parse(sys.stdin.read())
+    if args.frames:
+        xs = trace(program, args.frames * args.width * args.height)
+        for frame in render(xs, args.width, args.height):
+            print(show(frame, args.width), end="\n\n")
+    else:
+        print("a:", part_a(program))
+        print("b:", part_b(program), sep="\n")
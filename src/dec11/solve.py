@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 
-import sys
+import argparse
 import collections
+import concurrent.futures
+import contextlib
+import functools
+import sys
 from typing import Callable, Iterable, TypedDict
 
-input = sys.stdin.read()
 sys.set_int_max_str_digits(10000)
 
 
@@ -15,7 +18,18 @@ class Monkey(TypedDict):
     inspected: int
 
 
-def parse(input) -> Iterable[tuple[int, Monkey]]:
+def evaluate(expr: tuple[int | str, ...], x: int) -> int:
+    a, op, b = expr
+    a = x if a == "old" else a
+    b = x if b == "old" else b
+    match op:
+        case "*":
+            return a * b
+        case "+":
+            return a + b
+
+
+def parse_monkeys(input) -> Iterable[tuple[int, Monkey]]:
     def ix(monkey):
         return int(monkey[0].split()[-1].strip(":"))
 
@@ -29,24 +43,10 @@ def parse(input) -> Iterable[tuple[int, Monkey]]:
         )
 
     def operation(monkey):
-        expr = monkey[2].split()[-3:]
-
-        def oprnd(x, a):
-            match a:
-                case "old":
-                    return x
-                case d:
-                    return int(d)
-
-        def eval(x):
-            a, b = oprnd(x, expr[0]), oprnd(x, expr[2])
-            match expr[1]:
-                case "*":
-                    return a * b
-                case "+":
-                    return a + b
-
-        return eval
+        # a partial of a module-level function, so monkeys can be pickled
+        a, op, b = monkey[2].split()[-3:]
+        a, b = (v if v == "old" else int(v) for v in (a, b))
+        return functools.partial(evaluate, (a, op, b))
 
     def test(monkey):
         denominator = int(monkey[3].split()[-1])
@@ -86,6 +86,17 @@ def throw(monkeys, i, relax):
             monkeys[monkey["test"][2]]["items"].append(item)
 
 
+def parse(input: str) -> dict[int, Monkey]:
+    return dict(parse_monkeys(input))
+
+
+def fresh(monkeys: dict[int, Monkey]) -> dict[int, Monkey]:
+    return {
+        i: {**m, "items": collections.deque(m["items"]), "inspected": 0}
+        for i, m in monkeys.items()
+    }
+
+
 def monkey_business(monkeys):
     hi, snd = -1, -1
     for x in (m["inspected"] for m in monkeys.values()):
@@ -97,8 +108,8 @@ def monkey_business(monkeys):
     return hi * snd
 
 
-def a():
-    monkeys = dict(parse(input))
+def part_a(monkeys: dict[int, Monkey]) -> int:
+    monkeys = fresh(monkeys)
 
     for _ in range(20):
         for i in monkeys.keys():
@@ -107,15 +118,102 @@ def a():
     return monkey_business(monkeys)
 
 
-def b():
-    monkeys = dict(parse(input))
+# the monkeys by their position in the round: their operations, their
+# tests with targets as positions, and the product of their divisors
+Rules = tuple[list, list[tuple[int, int, int]], int]
 
-    for _ in range(10000):
-        for i in monkeys.keys():
-            throw(monkeys, i, relax=False)
 
+def rules(monkeys: dict[int, Monkey]) -> Rules:
+    ids = list(monkeys)
+    ops = [m["op"] for m in monkeys.values()]
+    tests = [
+        (d, ids.index(if_true), ids.index(if_false))
+        for d, if_true, if_false in (m["test"] for m in monkeys.values())
+    ]
+    divisor = 1
+    for d, _, _ in tests:
+        divisor *= d
+    return ops, tests, divisor
+
+
+def walk(
+    rules: Rules, k: int, worry: int, rounds: int
+) -> collections.Counter:
+    # without relief, an item moves independently of all the others, and
+    # with worry taken modulo the divisors' product its state at the start
+    # of a round, (monkey, worry), can only take finitely many values; once
+    # one repeats, the inspections from there on repeat too
+    ops, tests, divisor = rules
+
+    # every inspection in order, and where each round's inspections start
+    inspected: list[int] = []
+    rounds_at: list[int] = []
+    seen: dict[tuple[int, int], int] = {}
+    while len(rounds_at) < rounds and (k, worry) not in seen:
+        seen[k, worry] = len(rounds_at)
+        rounds_at.append(len(inspected))
+        while True:
+            inspected.append(k)
+            worry = ops[k](worry) % divisor
+            d, if_true, if_false = tests[k]
+            target = if_true if worry % d == 0 else if_false
+            # monkeys later in the round still get to it this round
+            done = target < k
+            k = target
+            if done:
+                break
+
+    counts = collections.Counter(inspected)
+    if len(rounds_at) < rounds:
+        start = seen[k, worry]
+        cycles, rest = divmod(rounds - start, len(rounds_at) - start)
+        rounds_at.append(len(inspected))
+        cycle = collections.Counter(inspected[rounds_at[start] :])
+        partial = inspected[rounds_at[start] : rounds_at[start + rest]]
+        for m, n in cycle.items():
+            counts[m] += n * (cycles - 1)
+        counts.update(partial)
+
+    return counts
+
+
+def part_b(
+    monkeys: dict[int, Monkey], rounds: int = 10000, workers: int = 1
+) -> int:
+    # every item's starting monkey, by position, and worry, as columns
+    ids = list(monkeys)
+    starts = [k for k, m in enumerate(monkeys.values()) for _ in m["items"]]
+    worries = [item for m in monkeys.values() for item in m["items"]]
+    walk_ = functools.partial(walk, rules(monkeys), rounds=rounds)
+
+    with contextlib.ExitStack() as stack:
+        map_ = map
+        if workers > 1:
+            pool = stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+            )
+            chunk = max(1, len(starts) // (workers * 4))
+            map_ = functools.partial(pool.map, chunksize=chunk)
+        counts = sum(map_(walk_, starts, worries), collections.Counter())
+
+    monkeys = fresh(monkeys)
+    for k, i in enumerate(ids):
+        monkeys[i]["inspected"] = counts[k]
     return monkey_business(monkeys)
 
 
-print("a:", a())
-print("b:", b())
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--rounds", type=int, default=10000)
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="walk the items in this many processes",
+    )
+    args = parser.parse_args()
+
+    monkeys = parse(sys.stdin.read())
+    print("a:", part_a(monkeys))
+    print("b:", part_b(monkeys, args.rounds, args.workers))
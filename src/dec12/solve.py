@@ -1,74 +1,82 @@
 #!/usr/bin/env python3
 
 import heapq
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc.grid import Grid  # noqa: E402
 
-def parse():
-    heightmap = {}
-    S, E = None, None
-    for y, line in enumerate(sys.stdin.readlines()):
-        for x, e in enumerate(line.strip()):
-            if e == "S":
-                S = (x, y)
-            if e == "E":
-                E = (x, y)
-            heightmap[x, y] = e.replace("S", "a").replace("E", "z")
 
-    return heightmap, S, E
+def elevation(e: str) -> int:
+    return ord("z") - ord({"S": "a", "E": "z"}.get(e, e))
 
 
-heightmap, S, E = parse()
+def parse(input: str) -> tuple[Grid, int, int]:
+    heightmap = Grid.parse(input, cell=elevation)
+    squares = "".join(input.split())
+    return heightmap, squares.index("S"), squares.index("E")
 
 
-def distance(a, b):
-    return abs(b[0] - a[0]) + abs(b[1] - a[1])
+def distance(heightmap: Grid, a: int, b: int) -> int:
+    ay, ax = divmod(a, heightmap.width)
+    by, bx = divmod(b, heightmap.width)
+    return abs(bx - ax) + abs(by - ay)
 
 
-def elevation(e):
-    return ord("z") - ord(heightmap[e])
+def solve_from(heightmap: Grid, S: int, E: int):
+    elevations = heightmap.cells
+    q: list[tuple[int, int, int, int]] = []
+    seen = bytearray(len(elevations))
+    seen[S] = 1
 
-
-def solve_from(S):
-    q: list[tuple[int, int, int, tuple[tuple[int, int]]]] = []
-    seen = set([S])
-
-    heapq.heappush(q, (0, distance(S, E), elevation(S), S))
+    heapq.heappush(q, (0, distance(heightmap, S, E), elevations[S], S))
 
     while q:
-        steps, _, h, (x, y) = heapq.heappop(q)
+        steps, _, h, p = heapq.heappop(q)
 
-        if (x, y) == E:
+        if p == E:
             return steps
 
-        for p in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
-            if p not in heightmap:
-                continue
-            if h - elevation(p) > 1:
+        for n in heightmap.neighbors(p):
+            if h - elevations[n] > 1:
                 continue
-            if p in seen:
+            if seen[n]:
                 continue
 
-            seen.add(p)
+            seen[n] = 1
             heapq.heappush(
                 q,
                 (
                     steps + 1,
-                    distance(p, E),
-                    elevation(p),
-                    p,
+                    distance(heightmap, n, E),
+                    elevations[n],
+                    n,
                 ),
             )
 
 
-def b():
+def part_a(problem):
+    heightmap, S, E = problem
+    return solve_from(heightmap, S, E)
+
+
+def part_b(problem):
+    heightmap, _, E = problem
+    lowest = elevation("a")
     return min(
         filter(
             None,
-            map(solve_from, (p for p, e in heightmap.items() if e == "a")),
+            (
+                solve_from(heightmap, p, E)
+                for p, e in enumerate(heightmap.cells)
+                if e == lowest
+            ),
         )
     )
 
 
-print("a:", solve_from(S))
-print("b:", b())
+if __name__ == "__main__":
+    problem = parse(sys.stdin.read())
+    print("a:", part_a(problem))
+    print("b:", part_b(problem))
@@ -9,7 +9,8 @@ def pair(lines):
         yield eval(line.strip())
 
 
-pairs = list(map(list, map(pair, sys.stdin.read().split("\n\n"))))
+def parse(input: str) -> list[list]:
+    return list(map(list, map(pair, input.split("\n\n"))))
 
 
 def lt(a, b):
@@ -37,11 +38,11 @@ def lt(a, b):
             raise Exception(f"unhandled: comparing {a} to {b}")
 
 
-def a():
+def part_a(pairs: list[list]) -> int:
     return sum(i + 1 for i, (a, b) in enumerate(pairs) if lt(a, b) == -1)
 
 
-def b():
+def part_b(pairs: list[list]) -> int:
     a, b = [[2]], [[6]]
     packets = sorted(
         [*(item for p in pairs for item in p), a, b],
@@ -51,5 +52,7 @@ def b():
     return (1 + packets.index(a)) * (1 + packets.index(b))
 
 
-print("a:", a())
-print("b:", b())
+if __name__ == "__main__":
+    pairs = parse(sys.stdin.read())
+    print("a:", part_a(pairs))
+    print("b:", part_b(pairs))
@@ -1,36 +1,50 @@
 #!/usr/bin/env python3
 
 import operator
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc.grid import Grid  # noqa: E402
 
-underground = set()
 
-for path in sys.stdin.readlines():
-    coords = [tuple(map(int, p.split(","))) for p in path.split(" -> ")]
+AIR, ROCK, SAND = 0, 1, 2
+SOURCE = (500, 0)
 
-    for i in range(1, len(coords)):
-        byx = sorted([coords[i - 1], coords[i]], key=operator.itemgetter(0))
-        byy = sorted([coords[i - 1], coords[i]], key=operator.itemgetter(1))
+
+def parse(input: str) -> Grid:
+    segments = []
+    for path in input.splitlines():
+        if not path.strip():
+            continue
+        coords = [tuple(map(int, p.split(","))) for p in path.split(" -> ")]
+        segments.extend(zip(coords, coords[1:]))
+
+    # leave room for the floor in part b, where sand piles up in a triangle
+    # as wide as it is tall around the source
+    yhi = max(y for segment in segments for _, y in segment)
+    floor = yhi + 2
+    xs = [x for segment in segments for x, _ in segment]
+    xlo = min(*xs, SOURCE[0] - floor - 1)
+    xhi = max(*xs, SOURCE[0] + floor + 1)
+
+    underground = Grid(xhi - xlo + 1, floor + 1, origin=(xlo, 0))
+    for a, b in segments:
+        byx = sorted([a, b], key=operator.itemgetter(0))
+        byy = sorted([a, b], key=operator.itemgetter(1))
         for x in range(byx[0][0], byx[1][0] + 1):
             for y in range(byy[0][1], byy[1][1] + 1):
-                underground.add((x, y))
+                underground[x, y] = ROCK
 
-xlo, xhi, ylo, yhi = None, None, None, None
-for (x, y) in underground:
-    if xlo is None or x < xlo:
-        xlo = x
-    if xhi is None or x > xhi:
-        xhi = x
-    if ylo is None or y < ylo:
-        ylo = y
-    if yhi is None or y > yhi:
-        yhi = y
+    return underground
 
 
-def show(sand, floor=None):
+def show(underground: Grid, floor=None):
     xlo, xhi, ylo, yhi = None, None, None, None
-    for (x, y) in underground.union(sand):
+    occupied = (
+        underground.point(i) for i, c in enumerate(underground.cells) if c
+    )
+    for (x, y) in occupied:
         if xlo is None or x < xlo:
             xlo = x
         if xhi is None or x > xhi:
@@ -72,9 +86,9 @@ def show(sand, floor=None):
                 "+"
                 if (x, y) == (500, 0)
                 else "o"
-                if (x, y) in sand
+                if underground[x, y] == SAND
                 else "#"
-                if (x, y) in underground or (floor and y == floor)
+                if underground[x, y] == ROCK or (floor and y == floor)
                 else "."
                 for x in range(xlo, xhi + 1)
             )
@@ -83,46 +97,46 @@ def show(sand, floor=None):
     )
 
 
-def produce_one(sand, floor=None):
-    (x, y) = (500, 0)
-
-    resting = underground.union(sand)
-
-    def at_rest():
-        return all(map(lambda d: (x + d, y + 1) in resting, (-1, 0, 1))) or (
-            floor and y + 1 == floor
-        )
+def produce_one(underground: Grid, floor=None) -> bool:
+    cells, width = underground.cells, underground.width
+    yhi = underground.height - 3
+    source = underground.index(*SOURCE)
+    p, y = source, SOURCE[1]
 
-    while not at_rest():
+    while not floor or y + 1 < floor:
         if not floor and y >= yhi:
             return False
 
-        if not (x, y + 1) in resting:
-            y += 1
-        elif not (x - 1, y + 1) in resting:
-            x -= 1
-            y += 1
-        elif not (x + 1, y + 1) in resting:
-            x += 1
-            y += 1
+        below = p + width
+        if cells[below] == AIR:
+            p = below
+        elif cells[below - 1] == AIR:
+            p = below - 1
+        elif cells[below + 1] == AIR:
+            p = below + 1
+        else:
+            break
+        y += 1
 
-    sand.add((x, y))
-    return (x, y) != (500, 0)
+    cells[p] = SAND
+    return p != source
 
 
-def a():
-    sand = set()
-    while produce_one(sand):
+def part_a(underground: Grid) -> int:
+    underground = underground.copy()
+    while produce_one(underground):
         pass
-    return len(sand)
+    return underground.cells.count(SAND)
 
 
-def b():
-    sand = set()
-    while produce_one(sand, floor=yhi + 2):
+def part_b(underground: Grid) -> int:
+    underground = underground.copy()
+    while produce_one(underground, floor=underground.height - 1):
         pass
-    return len(sand)
+    return underground.cells.count(SAND)
 
 
-print("a:", a())
-print("b:", b())
+if __name__ == "__main__":
+    underground = parse(sys.stdin.read())
+    print("a:", part_a(underground))
+    print("b:", part_b(underground))
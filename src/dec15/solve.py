@@ -1,43 +1,25 @@
 #!/usr/bin/env python3
 
 import heapq
-import re
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc.ints import columns, ints  # noqa: E402
 
-def parse():
-    rx = re.compile(
-        " ".join(
-            [
-                r"Sensor at x=(-?\d+), y=(-?\d+):",
-                r"closest beacon is at x=(-?\d+), y=(-?\d+)",
-            ]
-        )
-    )
-    sensors: list[tuple[tuple[int, int], int]] = []
+Sensors = list[tuple[tuple[int, int], int]]
+
+
+def parse(input: str):
+    sensors: Sensors = []
     beacons: set[tuple[int, int]] = set()
-    for line in sys.stdin.readlines():
-        m = rx.match(line.strip())
-        if not m:
-            print(
-                "could not parse sensor from line; skipping:",
-                line,
-                file=sys.stderr,
-            )
-            continue
-        (sx, sy), (bx, by) = (
-            (int(m.group(1)), int(m.group(2))),
-            (int(m.group(3)), int(m.group(4))),
-        )
+    for sx, sy, bx, by in zip(*columns(ints(input, signed=True), 4)):
         sensors.append(((sx, sy), abs(bx - sx) + abs(by - sy)))
         beacons.add((bx, by))
     return sensors, beacons
 
 
-sensors, beacons = parse()
-
-
-def one_d(xlo, xhi, y):
+def one_d(sensors: Sensors, xlo, xhi, y):
     q = [(xhi - xlo, xlo, xhi)]
 
     i = 0
@@ -86,7 +68,7 @@ def seen_by(xlo, xhi, ylo, yhi, sx, sy, d):
     )
 
 
-def two_d(*bounds):
+def two_d(sensors: Sensors, *bounds):
     q = [(size(*bounds), bounds)]
 
     while q:
@@ -102,19 +84,23 @@ def two_d(*bounds):
             heapq.heappush(q, (size(*box), box))
 
 
-def a():
+def part_a(problem) -> int:
+    sensors, _ = problem
     y = 2000000
     xlo = min(sx - (d - abs(y - sy)) for (sx, sy), d in sensors)
     xhi = max(sx + (d - abs(y - sy)) for (sx, sy), d in sensors)
-    candidates = list(one_d(xlo, xhi, y))
+    candidates = list(one_d(sensors, xlo, xhi, y))
 
     return xhi - xlo - len(candidates)
 
 
-def b():
-    x, y = next(two_d(0, 4000000, 0, 4000000))
+def part_b(problem) -> int:
+    sensors, _ = problem
+    x, y = next(two_d(sensors, 0, 4000000, 0, 4000000))
     return 4000000 * x + y
 
 
-print("a:", a())
-print("b:", b())
+if __name__ == "__main__":
+    problem = parse(sys.stdin.read())
+    print("a:", part_a(problem))
+    print("b:", part_b(problem))
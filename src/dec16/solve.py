@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import collections
+import dataclasses
 import functools
 import itertools
 import re
@@ -10,19 +11,29 @@ from typing import Iterable
 
 rx = re.compile(r"([A-Z]{2})|(\d+)")
 
-cave = {
-    m[0][0]: (int(m[1][1]), {v for v, _ in m[2:]})
-    for m in (rx.findall(line) for line in sys.stdin.readlines())
-}
+
+# compared by identity, so the caches below can be keyed on it cheaply
+@dataclasses.dataclass(frozen=True, eq=False)
+class Cave:
+    layout: dict[str, tuple[int, set[str]]]
+    useful_valves: frozenset[str]
+
+
+def parse(input: str) -> Cave:
+    layout = {
+        m[0][0]: (int(m[1][1]), {v for v, _ in m[2:]})
+        for m in (rx.findall(line) for line in input.splitlines() if line)
+    }
+    return Cave(layout, frozenset(v for v, (f, _) in layout.items() if f > 0))
 
 
 @functools.cache
-def steps_between(start: str, end: str) -> int:
+def steps_between(cave: Cave, start: str, end: str) -> int:
     q: collections.deque[tuple[str, int]] = collections.deque([(start, 0)])
     seen = set()
     while q:
         (here, steps) = q.popleft()
-        for there in cave[here][1]:
+        for there in cave.layout[here][1]:
             if there == end:
                 return steps + 1
 
@@ -33,11 +44,8 @@ def steps_between(start: str, end: str) -> int:
         raise Exception(f"No path from {start} to {end} found!")
 
 
-useful_valves = {v for v, (f, _) in cave.items() if f > 0}
-
-
 @functools.cache
-def solve_for(time_limit, valves):
+def solve_for(cave: Cave, time_limit, valves):
     valves = set(valves.split(","))
     q: list[tuple[int, int, set[str], str]] = [(0, 0, set(), "AA")]
     best = 0
@@ -55,7 +63,7 @@ def solve_for(time_limit, valves):
             continue
 
         for valve in valves - open:
-            dt = steps_between(here, valve) + 1
+            dt = steps_between(cave, here, valve) + 1
 
             if time + dt > time_limit:
                 continue
@@ -63,7 +71,7 @@ def solve_for(time_limit, valves):
             q.append(
                 (
                     time + dt,
-                    score + (time_limit - time - dt) * cave[valve][0],
+                    score + (time_limit - time - dt) * cave.layout[valve][0],
                     open | {valve},
                     valve,
                 )
@@ -72,24 +80,24 @@ def solve_for(time_limit, valves):
     return best
 
 
-def partition(valves: set[str]) -> Iterable[tuple[set[str], set[str]]]:
+def partition(valves: frozenset[str]) -> Iterable[tuple[set[str], set[str]]]:
     for n in range(1, len(valves)):
         for subset in itertools.combinations(valves, n):
             yield set(subset), {v for v in valves if v not in subset}
 
 
-def a():
-    return solve_for(30, ",".join(useful_valves))
+def part_a(cave: Cave) -> int:
+    return solve_for(cave, 30, ",".join(cave.useful_valves))
 
 
-def b():
+def part_b(cave: Cave) -> int:
     best = 0
-    for me, elephant in partition(useful_valves):
+    for me, elephant in partition(cave.useful_valves):
         me = ",".join(sorted(me))
         elephant = ",".join(sorted(elephant))
 
-        mine = solve_for(26, me) if me else 0
-        elephants = solve_for(26, elephant) if elephant else 0
+        mine = solve_for(cave, 26, me) if me else 0
+        elephants = solve_for(cave, 26, elephant) if elephant else 0
 
         score = mine + elephants
 
@@ -99,5 +107,7 @@ def b():
     return best
 
 
-print("a:", a())
-print("b:", b())
+if __name__ == "__main__":
+    cave = parse(sys.stdin.read())
+    print("a:", part_a(cave))
+    print("b:", part_b(cave))
@@ -11,7 +11,9 @@ shapes: list[set[tuple[int, int]]] = [
     {(0, 0), (1, 0), (0, 1), (1, 1)},
 ]
 
-jets = [c for c in sys.stdin.read().strip()]
+
+def parse(input: str) -> list[str]:
+    return [c for c in input.strip()]
 
 
 def bottom(shape):
@@ -44,6 +46,7 @@ def hash(cave: set[tuple[int, int]]) -> int:
 
 
 def drop_rock(
+    jets: list[str],
     cave: set[tuple[int, int]],
     rock: set[tuple[int, int]],
     t: int,
@@ -67,6 +70,7 @@ def drop_rock(
 
 
 def drop_rocks(
+    jets: list[str],
     cave: set[tuple[int, int]],
     s: tuple[int, int],
     n: int,
@@ -76,6 +80,7 @@ def drop_rocks(
 
     for r in range(n):
         t, cave = drop_rock(
+            jets,
             cave,
             shapes[(r0 + r) % len(shapes)],
             t,
@@ -85,18 +90,20 @@ def drop_rocks(
     return t, cave
 
 
-def a():
-    _, cave = drop_rocks(set(), (0, 0), 2022)
+def part_a(jets: list[str]) -> int:
+    _, cave = drop_rocks(jets, set(), (0, 0), 2022)
     return top(cave)
 
 
-def b():
+def part_b(jets: list[str]) -> int:
     def find_cycle(keep=50):
         t, cave = 0, set()
         seen = {}
 
         for n in range(20_000):
-            t, cave = drop_rock(cave, shapes[n % len(shapes)], t, keep=keep)
+            t, cave = drop_rock(
+                jets, cave, shapes[n % len(shapes)], t, keep=keep
+            )
             k = (t % len(jets), n % len(shapes), hash(cave))
 
             if k in seen.keys():
@@ -113,13 +120,13 @@ def b():
 
     def drop_without_cycle(N, cycle, keep=50):
         (n0, h0), (n1, h1) = cycle
-        t, cave = drop_rocks(set(), (0, 0), n1, keep=keep)
+        t, cave = drop_rocks(jets, set(), (0, 0), n1, keep=keep)
 
         nc, nr = divmod(N - n1, n1 - n0)
         H = nc * (h1 - h0)
         cave = {(x, y + H) for x, y in cave}
 
-        t, cave = drop_rocks(cave, (t, n1), nr, keep=keep)
+        t, cave = drop_rocks(jets, cave, (t, n1), nr, keep=keep)
 
         return t, cave
 
@@ -130,5 +137,7 @@ def b():
     return top(cave)
 
 
-print("a:", a())
-print("b:", b())
+if __name__ == "__main__":
+    jets = parse(sys.stdin.read())
+    print("a:", part_a(jets))
+    print("b:", part_b(jets))
@@ -1,21 +1,28 @@
 #!/usr/bin/env python3
 
+import pathlib
 import sys
 import time
 
-cells = {
-    tuple((int(d) for d in line.strip().split(",")))
-    for line in sys.stdin.readlines()
-}
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc.ints import columns, ints  # noqa: E402
 
-xlo, xhi, ylo, yhi, zlo, zhi = (
-    min(x for x, _, _ in cells) - 1,
-    max(x for x, _, _ in cells) + 1,
-    min(y for _, y, _ in cells) - 1,
-    max(y for _, y, _ in cells) + 1,
-    min(z for _, _, z in cells) - 1,
-    max(z for _, _, z in cells) + 1,
-)
+Cells = set[tuple[int, int, int]]
+
+
+def parse(input: str) -> Cells:
+    return set(zip(*columns(ints(input, signed=True), 3)))
+
+
+def bounds(cells: Cells) -> tuple[int, int, int, int, int, int]:
+    return (
+        min(x for x, _, _ in cells) - 1,
+        max(x for x, _, _ in cells) + 1,
+        min(y for _, y, _ in cells) - 1,
+        max(y for _, y, _ in cells) + 1,
+        min(z for _, _, z in cells) - 1,
+        max(z for _, _, z in cells) + 1,
+    )
 
 
 def step(p, dx=0, dy=0, dz=0):
@@ -34,7 +41,7 @@ def neighbors(p):
     )
 
 
-def a():
+def part_a(cells: Cells) -> int:
     n = len(cells) * 6
     for cell in cells:
         for neighbor in neighbors(cell):
@@ -44,7 +51,8 @@ def a():
     return n
 
 
-def visualize(cells, z, if_in, if_out):
+def visualize(bounds, cells, z, if_in, if_out):
+    xlo, xhi, ylo, yhi, _, _ = bounds
     return "\n".join(
         "".join(
             if_in if (x, y, z) in cells else if_out for x in range(xlo, xhi)
@@ -53,7 +61,8 @@ def visualize(cells, z, if_in, if_out):
     )
 
 
-def b():
+def exterior(cells: Cells) -> tuple[int, set[tuple[int, int, int]]]:
+    xlo, xhi, ylo, yhi, zlo, zhi = bounds(cells)
     q = [(xlo, ylo, zlo)]
     N = 0
     seen = set()
@@ -76,14 +85,20 @@ def b():
     return N, seen
 
 
-def visualize_all():
+def part_b(cells: Cells) -> int:
+    return exterior(cells)[0]
+
+
+def visualize_all(cells: Cells):
     def side_by_side(columns, *, width=30):
         return "\n".join(
             "".join(c.ljust(width) for c in cs)
             for cs in zip(*(col.splitlines(keepends=False) for col in columns))
         )
 
-    _, seen = b()
+    _, seen = exterior(cells)
+    box = bounds(cells)
+    _, _, _, _, zlo, zhi = box
 
     for z in range(zlo, zhi + 1):
         print("\033c", end="")
@@ -95,6 +110,7 @@ def visualize_all():
                         [
                             "exact shape",
                             visualize(
+                                box,
                                 {
                                     (x, y, zp)
                                     for (x, y, zp) in cells
@@ -109,7 +125,7 @@ def visualize_all():
                     "\n".join(
                         [
                             "as seen in part b",
-                            visualize(seen, z, if_in=".", if_out="#"),
+                            visualize(box, seen, z, if_in=".", if_out="#"),
                         ]
                     ),
                 ]
@@ -119,7 +135,9 @@ def visualize_all():
         time.sleep(1)
 
 
-print("a:", a())
-print("b:", b()[0])
+if __name__ == "__main__":
+    cells = parse(sys.stdin.read())
+    print("a:", part_a(cells))
+    print("b:", part_b(cells))
 
-# visualize_all()
+    # visualize_all(cells)